@@ -272,9 +272,9 @@ def _load_player_index() -> Dict[str, Dict[str, object]]:
             raw = raw.get("rows") or []
         index: Dict[str, Dict[str, object]] = {}
         if isinstance(raw, list):
+            # 自前で書き出したファイルなので行ごとの型チェックはしない。
+            # dict 以外の行が混じっていれば下の except で「壊れている」扱いになる。
             for row in raw:
-                if not isinstance(row, dict):
-                    continue
                 sid = str(row.get("steam_id") or "")
                 if not sid:
                     continue
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict, field
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+import json
 import sys
 
 # プロジェクトルート (開発時: リポジトリ直下, exe 時: exe のあるディレクトリ)
@@ -58,6 +60,49 @@ def resource_path(*parts: str) -> Path:
     return BASE_DIR / "resources" / Path(*parts)
 
 
+def parse_taken_at(t_str: str) -> Optional[datetime]:
+    """Snapshot の taken_at(ISO8601) を UTC datetime に変換する。解析できない場合は None。"""
+
+    # 保存形式は "YYYY-MM-DDTHH:MM:SS[.ffffff]Z" 固定なので、まずは位置決め打ちで切り出す
+    # （fromisoformat + replace より生成オブジェクトが少ない）。形が違えば従来の解析へ回す。
+    if (
+        len(t_str) >= 19
+        and t_str[4] == "-"
+        and t_str[7] == "-"
+        and t_str[10] == "T"
+        and t_str[13] == ":"
+        and t_str[16] == ":"
+    ):
+        rest = t_str[19:]
+        if rest.endswith("Z"):
+            rest = rest[:-1]
+        micro = "0"
+        if rest[:1] == "." and 1 < len(rest) <= 7:
+            micro = rest[1:]
+            rest = ""
+        if not rest:
+            try:
+                return datetime(
+                    int(t_str[0:4]),
+                    int(t_str[5:7]),
+                    int(t_str[8:10]),
+                    int(t_str[11:13]),
+                    int(t_str[14:16]),
+                    int(t_str[17:19]),
+                    int(micro.ljust(6, "0")),
+                    tzinfo=timezone.utc,
+                )
+            except ValueError:
+                pass
+
+    try:
+        if t_str.endswith("Z"):
+            t_str = t_str[:-1]
+        return datetime.fromisoformat(t_str).replace(tzinfo=timezone.utc)
+    except Exception:  # noqa: BLE001
+        return None
+
+
 @dataclass
 class StarClearStat:
     """★ごとのクリア状況を表す統計。
@@ -182,6 +227,32 @@ class Snapshot:
     # BeatLeader 側の★別クリア統計
     beatleader_star_stats: List[StarClearStat] = field(default_factory=list)
 
+    @cached_property
+    def taken_at_dt(self) -> datetime:
+        """taken_at を UTC datetime に変換したもの（初回参照時に 1 回だけ解析する）。"""
+        dt = parse_taken_at(self.taken_at)
+        # 解析に失敗した場合は現在時刻でフォールバック
+        return dt if dt is not None else datetime.now(timezone.utc)
+
+    @cached_property
+    def accsaber_reloaded_total_maps_by_category(self) -> dict[str, Optional[int]]:
+        """AccSaber Reloaded のカテゴリ別 Ranked 譜面数（overall / true / standard / tech）。
+
+        overall が保存されていない場合は、取得できたカテゴリの合計で補う。
+        """
+        true_total = self.accsaber_reloaded_true_total_maps
+        standard_total = self.accsaber_reloaded_standard_total_maps
+        tech_total = self.accsaber_reloaded_tech_total_maps
+        overall = self.accsaber_reloaded_overall_total_maps
+        if overall is None and (true_total is not None or standard_total is not None or tech_total is not None):
+            overall = (true_total or 0) + (standard_total or 0) + (tech_total or 0)
+        return {
+            "overall": overall,
+            "true": true_total,
+            "standard": standard_total,
+            "tech": tech_total,
+        }
+
     @staticmethod
     def path_for(steam_id: str, taken_at: datetime) -> Path:
         SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
@@ -199,17 +270,20 @@ class Snapshot:
         data["beatleader_star_stats"] = [asdict(s) for s in self.beatleader_star_stats]
         data.pop("warnings", None)  # 実行時フラグは保存しない
 
-        import json
-
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
         return path
 
     @staticmethod
     def load(path: Path) -> "Snapshot":
-        import json
+        # json.loads はバイト列のまま渡せば UTF-8 を判定して解析するので、文字列への変換を挟まない
+        return Snapshot.from_dict(json.loads(path.read_bytes()))
+
+    @staticmethod
+    def from_dict(data: dict) -> "Snapshot":
+        """保存済み JSON を解析した dict から Snapshot を作る。渡された dict 自体は書き換えない。"""
 
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = dict(data)
 
         # ScoreSaber 側の★統計
         star_stats_raw = data.get("star_stats") or []
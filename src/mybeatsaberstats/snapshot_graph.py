@@ -1,147 +1,72 @@
 from __future__ import annotations
 
+import json
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from datetime import date, datetime, timezone, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-from PySide6.QtCore import QDate, QRect, QSize, Qt
-from PySide6.QtGui import QColor, QFont, QPainter, QPen
+from PySide6.QtCore import QDate, QEvent, QMimeData, QPoint, QPointF, QRect, QSize, Qt, QTimer
+from PySide6.QtGui import QColor, QDrag, QFont, QPainter, QPen, QPolygonF
 from PySide6.QtWidgets import (
-    QAbstractItemView,
+    QApplication,
     QColorDialog,
     QComboBox,
     QDateEdit,
     QDialog,
     QHBoxLayout,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
-    QListView,
+    QLayout,
+    QLayoutItem,
     QPushButton,
+    QScrollArea,
     QVBoxLayout,
     QWidget,
 )
 
-from .snapshot import Snapshot, BASE_DIR
+from .snapshot import Snapshot, StarClearStat, BASE_DIR
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _MetricDef:
     key: str
     label: str
     is_int: bool = False
 
 
-def _get_ss_star_metric_value(snap: Snapshot, key: str) -> Optional[float]:
-    """ScoreSaber 側 Stats の★別統計をグラフ用に取り出す。
-
-    key 形式: "star_ss_{star}_clear_count" / "star_ss_{star}_clear_rate" / "star_ss_{star}_avg_acc"
-    - clear_count: その★帯のクリア数
-    - clear_rate: 0.0-1.0 を 0-100(%) に変換して返す
-    - avg_acc: average_acc (0.0-100.0)
-    """
-
-    if not snap.star_stats:
-        return None
-
-    parts = key.split("_")
-    if len(parts) < 4 or parts[0] != "star" or parts[1] != "ss":
-        return None
-
-    try:
-        star = int(parts[2])
-    except ValueError:
-        return None
-
-    kind = "_".join(parts[3:])
-    attr: Optional[str]
-    multiplier = 1.0
-    if kind == "clear_count":
-        attr = "clear_count"
-    elif kind == "clear_rate":
-        attr = "clear_rate"
-        multiplier = 100.0  # % 表示用に 0-1 → 0-100
-    elif kind == "avg_acc":
-        attr = "average_acc"
-    else:
-        return None
-
-    for s in snap.star_stats:
-        if s.star != star:
-            continue
-        value = getattr(s, attr, None)
-        if value is None:
-            return None
-        try:
-            return float(value) * multiplier
-        except (TypeError, ValueError):
-            return None
-
-    return None
+# ★別メトリクスの種類: kind -> (StarClearStat の属性名, 倍率, ラベル, 整数表示か)
+_STAR_METRIC_KINDS: Tuple[Tuple[str, str, float, str, bool], ...] = (
+    ("clear_count", "clear_count", 1.0, "Clear Count", True),
+    ("clear_rate", "clear_rate", 100.0, "Clear Rate (%)", False),  # % 表示用に 0-1 → 0-100
+    ("avg_acc", "average_acc", 1.0, "Avg ACC", False),
+)
 
 
-def _get_bl_star_metric_value(snap: Snapshot, key: str) -> Optional[float]:
-    """BeatLeader 側 Stats の★別統計をグラフ用に取り出す。
+def _get_star_metric_value(
+    by_star: dict[int, StarClearStat], star: int, attr: str, multiplier: float
+) -> Optional[float]:
+    """Stats の★別統計をグラフ用に取り出す（ScoreSaber / BeatLeader 共通）。
 
-    key 形式: "star_bl_{star}_clear_count" / "star_bl_{star}_clear_rate" / "star_bl_{star}_avg_acc"
-    内容は ScoreSaber 側と同様。
+    by_star は 1 スナップショット分の {star: StarClearStat}。
+    star / attr / multiplier は "star_ss_{star}_{kind}" / "star_bl_{star}_{kind}" のキーから
+    SnapshotGraphDialog._star_key_map で事前に解決済みのものを渡す。
+    - clear_count: その★帯のクリア数
+    - clear_rate: 0.0-1.0 を 0-100(%) に変換して返す
+    - average_acc: average_acc (0.0-100.0)
     """
 
-    if not snap.beatleader_star_stats:
+    s = by_star.get(star)
+    if s is None:
         return None
-
-    parts = key.split("_")
-    if len(parts) < 4 or parts[0] != "star" or parts[1] != "bl":
+    value = getattr(s, attr, None)
+    if value is None:
         return None
-
     try:
-        star = int(parts[2])
-    except ValueError:
-        return None
-
-    kind = "_".join(parts[3:])
-    attr: Optional[str]
-    multiplier = 1.0
-    if kind == "clear_count":
-        attr = "clear_count"
-    elif kind == "clear_rate":
-        attr = "clear_rate"
-        multiplier = 100.0
-    elif kind == "avg_acc":
-        attr = "average_acc"
-    else:
+        return float(value) * multiplier
+    except (TypeError, ValueError):
         return None
 
-    for s in snap.beatleader_star_stats:
-        if s.star != star:
-            continue
-        value = getattr(s, attr, None)
-        if value is None:
-            return None
-        try:
-            return float(value) * multiplier
-        except (TypeError, ValueError):
-            return None
-
-    return None
-
-
-def _parse_snapshot_datetime(snap: Snapshot) -> datetime:
-    """Snapshot の taken_at(ISO8601) を UTC datetime に変換する。"""
-
-    t_str = snap.taken_at
-    try:
-        if t_str.endswith("Z"):
-            t_str = t_str[:-1]
-            dt_utc = datetime.fromisoformat(t_str).replace(tzinfo=timezone.utc)
-        else:
-            dt_utc = datetime.fromisoformat(t_str).replace(tzinfo=timezone.utc)
-    except Exception:  # noqa: BLE001
-        # 解析に失敗した場合は現在時刻でフォールバック
-        dt_utc = datetime.now(timezone.utc)
-    return dt_utc
-
 
 class LineChartWidget(QWidget):
     """単純な折れ線グラフを描画するウィジェット。"""
@@ -149,15 +74,48 @@ class LineChartWidget(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._points: List[Tuple[datetime, float]] = []
+        # _points の時刻(timestamp)と値を分けたもの。描画のたびに取り出さないよう set_data で作る
+        self._ts: List[float] = []
+        self._vs: List[float] = []
         self._label: str = ""
         self._t_min_explicit: Optional[datetime] = None
         self._t_max_explicit: Optional[datetime] = None
         self._y_as_int: bool = False
         self._y_inverted: bool = False
         self._color: QColor = QColor(0, 120, 215)  # 既定は Windows 系アクセントに近い青
+        self._line_pen = QPen(self._color)
+        self._line_pen.setWidth(2)
+        self._refresh_paint_cache()
+        # 非表示中に set_data された場合は再描画を保留し、showEvent でまとめて描く
+        self._dirty: bool = False
+        # 目盛りラベルのキャッシュ (キー, ラベル列)。リサイズ中など値域が変わらない再描画で使い回す
+        self._tick_cache: Optional[Tuple[tuple, List[str]]] = None
+        self._x_tick_cache: Optional[Tuple[tuple, List[Tuple[float, str]]]] = None
         self.setMinimumHeight(180)
         self.setMinimumWidth(260)
 
+    def _refresh_paint_cache(self) -> None:
+        """paintEvent で使うペン・フォントを現在のパレット/フォントから作り直す。
+
+        描画のたびに生成しないよう、パレットやフォントが変わったときだけ呼ぶ。
+        """
+        palette = self.palette()
+        self._axis_pen = QPen(palette.mid().color())
+        self._axis_pen.setWidth(1)
+        self._text_pen = QPen(palette.text().color())
+        base_font = self.font()
+        self._no_data_font = QFont(base_font)
+        self._no_data_font.setPointSize(base_font.pointSize() + 1)
+        self._tick_font = QFont(base_font)
+        self._tick_font.setPointSize(max(6, base_font.pointSize() - 1))
+        self._title_font = QFont(self._tick_font)
+        self._title_font.setBold(True)
+
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        if event.type() in (QEvent.Type.PaletteChange, QEvent.Type.FontChange):
+            self._refresh_paint_cache()
+        super().changeEvent(event)
+
     def set_data(
         self,
         points: List[Tuple[datetime, float]],
@@ -165,13 +123,30 @@ class LineChartWidget(QWidget):
         t_min: Optional[datetime] = None,
         t_max: Optional[datetime] = None,
         y_as_int: bool = False,
+        presorted: bool = False,
     ) -> None:
-        self._points = sorted(points, key=lambda p: p[0])
+        """描画する点列と軸の設定を与える。
+
+        presorted=True の場合、points は時刻昇順に並んでいるものとしてソートを省略する
+        （並びが保証できない呼び出し側は False のままにすること）。
+        """
+        self._points = list(points) if presorted else sorted(points, key=lambda p: p[0])
+        self._ts = [p[0].timestamp() for p in self._points]
+        self._vs = [p[1] for p in self._points]
         self._label = label
         self._t_min_explicit = t_min
         self._t_max_explicit = t_max
         self._y_as_int = y_as_int
-        self.update()
+        if self.isVisible():
+            self.update()
+        else:
+            self._dirty = True
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        if self._dirty:
+            self._dirty = False
+            self.update()
 
     def set_y_inverted(self, inverted: bool) -> None:
         self._y_inverted = inverted
@@ -181,19 +156,23 @@ class LineChartWidget(QWidget):
         """折れ線の色を設定する。"""
         if color.isValid():
             self._color = QColor(color)
+            self._line_pen.setColor(self._color)
             self.update()
 
     def paintEvent(self, event) -> None:  # type: ignore[override]
-        """QWidget.paintEvent のオーバーライド。折れ線グラフを描画する。"""
+        """QWidget.paintEvent のオーバーライド。折れ線グラフを描画する。
+
+        スクロールで画面外に出ているなど見えている部分が無い場合は何もしない。
+        """
+        if self.visibleRegion().isEmpty() or event.rect().isEmpty():
+            return
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         painter.fillRect(self.rect(), self.palette().window())
 
         if not self._points:
-            painter.setPen(self.palette().text().color())
-            font = painter.font()
-            font.setPointSize(font.pointSize() + 1)
-            painter.setFont(font)
+            painter.setPen(self._text_pen)
+            painter.setFont(self._no_data_font)
             painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "No data")
             painter.end()
             return
@@ -210,8 +189,8 @@ class LineChartWidget(QWidget):
             max(10, self.height() - margin_top - margin_bottom),
         )
 
-        times = [p[0].timestamp() for p in self._points]
-        values = [p[1] for p in self._points]
+        times = self._ts
+        values = self._vs
         # 横軸は指定があれば From/To の範囲を優先し、無ければデータ範囲を使う
         if self._t_min_explicit is not None and self._t_max_explicit is not None:
             t_min = self._t_min_explicit.timestamp()
@@ -231,24 +210,27 @@ class LineChartWidget(QWidget):
         def map_x(t: float) -> int:
             return area.left() + int((t - t_min) / (t_max - t_min) * area.width())
 
-        def map_y(v: float) -> int:
-            if self._y_inverted:
-                return area.top() + int((v - v_min) / (v_max - v_min) * area.height())
-            return area.bottom() - int((v - v_min) / (v_max - v_min) * area.height())
-
         # 軸
-        axis_pen = QPen(self.palette().mid().color())
-        axis_pen.setWidth(1)
-        painter.setPen(axis_pen)
+        tick_pen = self._axis_pen
+        text_pen = self._text_pen
+        painter.setPen(tick_pen)
         painter.drawLine(area.bottomLeft(), area.bottomRight())
         painter.drawLine(area.bottomLeft(), area.topLeft())
 
         # 目盛り (Y軸は4分割程度)
-        tick_pen = QPen(self.palette().mid().color())
-        text_pen = QPen(self.palette().text().color())
-        font = painter.font()
-        font.setPointSize(max(6, font.pointSize() - 1))
-        painter.setFont(font)
+        painter.setFont(self._tick_font)
+
+        y_key = (v_min, v_max, self._y_as_int, area.height())
+        if self._tick_cache is None or self._tick_cache[0] != y_key:
+            y_labels: List[str] = []
+            for i in range(5):
+                v = v_min + (i / 4.0) * (v_max - v_min)
+                if self._y_as_int:
+                    y_labels.append(str(int(round(v))))
+                else:
+                    y_labels.append(f"{v:.1f}")
+            self._tick_cache = (y_key, y_labels)
+        y_labels = self._tick_cache[1]
 
         for i in range(5):
             frac = i / 4.0
@@ -258,19 +240,13 @@ class LineChartWidget(QWidget):
             else:
                 frac_screen = frac
             y = area.bottom() - int(frac_screen * area.height())
-            v = v_min + frac * (v_max - v_min)
             painter.setPen(tick_pen)
             painter.drawLine(area.left() - 4, y, area.left(), y)
-            if self._y_as_int:
-                text = str(int(round(v)))
-            else:
-                text = f"{v:.1f}"
             painter.setPen(text_pen)
-            painter.drawText(2, y + 4, text)
+            painter.drawText(2, y + 4, y_labels[i])
 
         # X軸の日付目盛り
         # グラフ幅に応じて 5〜10 本程度になるよう、きりの良い間隔を自動選択する
-        x_positions: List[float] = []
         d_start = (self._t_min_explicit.date() if self._t_min_explicit is not None
                    else datetime.fromtimestamp(t_min).astimezone().date())
         d_end = (self._t_max_explicit.date() if self._t_max_explicit is not None
@@ -287,51 +263,57 @@ class LineChartWidget(QWidget):
                 interval_days = _cand
                 break
 
-        cur = d_start
-        while cur <= d_end:
-            dt_tick = datetime(cur.year, cur.month, cur.day, 0, 0, 0)
-            x_positions.append(dt_tick.timestamp())
-            cur += timedelta(days=interval_days)
-        # 末尾が d_end と離れている場合は終端を追加
-        dt_end_ts = datetime(d_end.year, d_end.month, d_end.day, 0, 0, 0).timestamp()
-        if not x_positions or abs(x_positions[-1] - dt_end_ts) > interval_days * 86400 * 0.5:
-            x_positions.append(dt_end_ts)
-
-        for t in x_positions:
+        x_key = (d_start, d_end, interval_days)
+        if self._x_tick_cache is None or self._x_tick_cache[0] != x_key:
+            # 目盛りは日付そのものから作るので、ラベルも timestamp を経由せず日付から直接書式化する
+            x_ticks: List[Tuple[float, str]] = []
+            cur = d_start
+            while cur <= d_end:
+                dt_tick = datetime(cur.year, cur.month, cur.day, 0, 0, 0)
+                x_ticks.append((dt_tick.timestamp(), cur.strftime("%m-%d")))
+                cur += timedelta(days=interval_days)
+            # 末尾が d_end と離れている場合は終端を追加
+            dt_end_ts = datetime(d_end.year, d_end.month, d_end.day, 0, 0, 0).timestamp()
+            if not x_ticks or abs(x_ticks[-1][0] - dt_end_ts) > interval_days * 86400 * 0.5:
+                x_ticks.append((dt_end_ts, d_end.strftime("%m-%d")))
+            self._x_tick_cache = (x_key, x_ticks)
+
+        for t, text in self._x_tick_cache[1]:
             x = map_x(t)
-            dt = datetime.fromtimestamp(t).astimezone()
-            text = dt.strftime("%m-%d")
             painter.setPen(tick_pen)
             painter.drawLine(x, area.bottom(), x, area.bottom() + 4)
             painter.setPen(text_pen)
             painter.drawText(x - 20, area.bottom() + 16, 40, 16, Qt.AlignmentFlag.AlignHCenter, text)
 
         # 折れ線（データそのままを直線で結ぶ）
-        line_pen = QPen(self._color)
-        line_pen.setWidth(2)
-        painter.setPen(line_pen)
-
-        last_x: Optional[int] = None
-        last_y: Optional[int] = None
-        for dt_val, v in self._points:
-            x = map_x(dt_val.timestamp())
-            y = map_y(v)
-            if last_x is not None and last_y is not None:
-                painter.drawLine(last_x, last_y, x, y)
-            last_x, last_y = x, y
+        painter.setPen(self._line_pen)
+
+        # 座標変換は点ごとに関数を呼ばず、内包表記でまとめて行う
+        x_left = area.left()
+        t_span = t_max - t_min
+        width = area.width()
+        xs = [x_left + int((t - t_min) / t_span * width) for t in times]
+        v_span = v_max - v_min
+        height = area.height()
+        if self._y_inverted:
+            y_top = area.top()
+            ys = [y_top + int((v - v_min) / v_span * height) for v in values]
+        else:
+            y_bottom = area.bottom()
+            ys = [y_bottom - int((v - v_min) / v_span * height) for v in values]
+
+        # 1 本ずつ drawLine せず、頂点列にまとめて 1 回で描く
+        if len(xs) > 1:
+            painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(xs, ys)]))
 
         # 1 点だけの場合は小さな点を描いておく
-        if len(self._points) == 1:
-            x = map_x(self._points[0][0].timestamp())
-            y = map_y(self._points[0][1])
-            painter.drawEllipse(x - 2, y - 2, 4, 4)
+        if len(xs) == 1:
+            painter.drawEllipse(xs[0] - 2, ys[0] - 2, 4, 4)
 
         # タイトル
         if self._label:
-            title_font = QFont(painter.font())
-            title_font.setBold(True)
-            painter.setFont(title_font)
-            painter.setPen(self.palette().text().color())
+            painter.setFont(self._title_font)
+            painter.setPen(self._text_pen)
             painter.drawText(
                 margin_left,
                 4,
@@ -344,47 +326,132 @@ class LineChartWidget(QWidget):
         painter.end()
 
 
-class _GraphListWidget(QListWidget):
-    """グラフ用のリスト。IconMode + setItemWidget の並べ替えを自前で処理する。
+# グラフ並べ替えのドラッグで使う MIME タイプ（中身は使わず、source() で移動元を判定する）
+_GRAPH_DRAG_MIME = "application/x-mybeatsaberstats-graph"
+
+
+class _FlowLayout(QLayout):
+    """子ウィジェットを左上から右へ並べ、幅に応じて折り返すレイアウト（Qt の FlowLayout 例と同等）。"""
+
+    def __init__(self, parent: Optional[QWidget] = None, spacing: int = 8) -> None:
+        super().__init__(parent)
+        self._items: List[QLayoutItem] = []
+        self.setContentsMargins(spacing, spacing, spacing, spacing)
+        self.setSpacing(spacing)
+
+    def addItem(self, item: QLayoutItem) -> None:  # type: ignore[override]
+        self._items.append(item)
+
+    def count(self) -> int:  # type: ignore[override]
+        return len(self._items)
+
+    def itemAt(self, index: int) -> Optional[QLayoutItem]:  # type: ignore[override]
+        if 0 <= index < len(self._items):
+            return self._items[index]
+        return None
+
+    def takeAt(self, index: int) -> Optional[QLayoutItem]:  # type: ignore[override]
+        if 0 <= index < len(self._items):
+            return self._items.pop(index)
+        return None
+
+    def move_item(self, src: int, dst: int) -> None:
+        """src 番目の要素を dst 番目へ移動して再配置する。"""
+        self._items.insert(dst, self._items.pop(src))
+        self.relayout()
+
+    def relayout(self) -> None:
+        """要素の増減・入れ替え後に、すぐ配置し直す。
+
+        invalidate() だけだと LayoutRequest の処理待ちになり、一瞬古い位置のまま描画されるため。
+        """
+        self.invalidate()
+        self.activate()
+
+    def expandingDirections(self) -> Qt.Orientation:  # type: ignore[override]
+        return Qt.Orientation(0)
 
-    QListWidget の InternalMove は setItemWidget で載せたウィジェットを
-    移動時に引き継がないため、ドロップが失敗したり空セルになったりする
-    （位置やタイミングで「できたりできなかったり」する）。そこで dropEvent を
-    オーバーライドし、Qt 本体の移動は行わずに親へ並べ替えを依頼する。
+    def hasHeightForWidth(self) -> bool:  # type: ignore[override]
+        return True
+
+    def heightForWidth(self, width: int) -> int:  # type: ignore[override]
+        return self._do_layout(QRect(0, 0, width, 0), test_only=True)
+
+    def setGeometry(self, rect: QRect) -> None:  # type: ignore[override]
+        super().setGeometry(rect)
+        self._do_layout(rect, test_only=False)
+
+    def sizeHint(self) -> QSize:  # type: ignore[override]
+        return self.minimumSize()
+
+    def minimumSize(self) -> QSize:  # type: ignore[override]
+        size = QSize()
+        for item in self._items:
+            size = size.expandedTo(item.minimumSize())
+        m = self.contentsMargins()
+        return size + QSize(m.left() + m.right(), m.top() + m.bottom())
+
+    def _do_layout(self, rect: QRect, test_only: bool) -> int:
+        m = self.contentsMargins()
+        effective = rect.adjusted(m.left(), m.top(), -m.right(), -m.bottom())
+        spacing = self.spacing()
+        x = effective.x()
+        y = effective.y()
+        line_height = 0
+        for item in self._items:
+            hint = item.sizeHint()
+            next_x = x + hint.width() + spacing
+            if next_x - spacing > effective.right() and line_height > 0:
+                x = effective.x()
+                y += line_height + spacing
+                next_x = x + hint.width() + spacing
+                line_height = 0
+            if not test_only:
+                item.setGeometry(QRect(QPoint(x, y), hint))
+            x = next_x
+            line_height = max(line_height, hint.height())
+        return y + line_height - rect.y() + m.bottom()
+
+
+class _GraphContainer(QWidget):
+    """グラフを並べるスクロール領域の中身。グラフのドロップを受けて並べ替えを親へ依頼する。
+
+    以前は QListWidget(IconMode) + setItemWidget で並べていたが、グラフごとに
+    リスト項目の管理・ヒットテストが増えて重いため、FlowLayout に直接載せている。
     """
 
     def __init__(self, owner: "SnapshotGraphDialog") -> None:
         super().__init__(owner)
         self._owner = owner
-
-    def startDrag(self, supportedActions) -> None:  # type: ignore[override]
-        # MoveAction のままだと Qt が元アイテムを自動削除し、自前の並べ替えと
-        # 二重処理になってしまう。CopyAction で実行して自動削除を抑止する。
-        super().startDrag(Qt.DropAction.CopyAction)
+        self.setAcceptDrops(True)
+        self.flow = _FlowLayout(self)
 
     def dragEnterEvent(self, event) -> None:  # type: ignore[override]
-        if event.source() is self:
-            event.accept()
+        if event.mimeData().hasFormat(_GRAPH_DRAG_MIME) and event.source() in self._owner._graphs:
+            event.acceptProposedAction()
         else:
-            super().dragEnterEvent(event)
+            event.ignore()
 
     def dragMoveEvent(self, event) -> None:  # type: ignore[override]
-        if event.source() is self:
-            event.accept()
+        if event.mimeData().hasFormat(_GRAPH_DRAG_MIME):
+            event.acceptProposedAction()
         else:
-            super().dragMoveEvent(event)
+            event.ignore()
 
     def dropEvent(self, event) -> None:  # type: ignore[override]
-        if event.source() is not self:
-            super().dropEvent(event)
+        graphs = self._owner._graphs
+        source = event.source()
+        if source not in graphs:
+            event.ignore()
             return
-        src_row = self.currentRow()
         pos = event.position().toPoint()
-        target_item = self.itemAt(pos)
-        dst_row = self.count() - 1 if target_item is None else self.row(target_item)
-        # Qt 本体の InternalMove は呼ばず（ウィジェットが失われるため）自前で並べ替える
-        self._owner._move_graph(src_row, dst_row)
-        event.accept()
+        dst_row = len(graphs) - 1
+        for i, w in enumerate(graphs):
+            if w.geometry().contains(pos):
+                dst_row = i
+                break
+        self._owner._move_graph(graphs.index(source), dst_row)
+        event.acceptProposedAction()
 
 
 class SnapshotGraphDialog(QDialog):
@@ -398,6 +465,22 @@ class SnapshotGraphDialog(QDialog):
 
         self._snapshots = list(snapshots)
         self._snapshots.sort(key=lambda s: s.taken_at)
+        # 撮影日はグラフ更新のたびに使うので、id(snap) をキーに引けるようにしておく
+        # （self._snapshots を差し替える場合は作り直すこと）
+        self._parsed_date: dict[int, date] = {id(s): s.taken_at_dt.date() for s in self._snapshots}
+        # id(snap) -> (SS の {star: StarClearStat}, BL の {star: StarClearStat})
+        # 同じ★が重複していた場合は従来の線形探索と同じく先頭のものを採用する
+        self._star_maps: dict[int, Tuple[dict[int, StarClearStat], dict[int, StarClearStat]]] = {
+            id(s): (
+                {st.star: st for st in reversed(s.star_stats)},
+                {st.star: st for st in reversed(s.beatleader_star_stats)},
+            )
+            for s in self._snapshots
+        }
+        # メトリクスごとの (日付, 値) 列。初回参照時に作り、以降は期間で切り出すだけにする
+        self._series_cache: dict[str, Tuple[List[date], List[Tuple[datetime, float]]]] = {}
+        # ★別メトリクスのキー -> (star, 属性名, 倍率)。_build_metric_defs で埋める
+        self._star_key_map: dict[str, Tuple[int, str, float]] = {}
 
         layout = QVBoxLayout(self)
 
@@ -434,19 +517,17 @@ class SnapshotGraphDialog(QDialog):
 
         layout.addLayout(control_row)
 
-        # 中央: 複数グラフを並べるリスト（ドラッグ＆ドロップで並べ替え可）
+        # 中央: 複数グラフを並べる領域（ドラッグ＆ドロップで並べ替え可）
         # 横方向に左上から右へ配置し、幅に応じて折り返す。
-        self.list_widget = _GraphListWidget(self)
-        self.list_widget.setViewMode(QListView.ViewMode.IconMode)
-        self.list_widget.setFlow(QListView.Flow.LeftToRight)
-        self.list_widget.setWrapping(True)
-        self.list_widget.setResizeMode(QListView.ResizeMode.Adjust)
-        self.list_widget.setSpacing(8)
-        self.list_widget.setMovement(QListView.Movement.Snap)
-        self.list_widget.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
-        # ドラッグ開始には選択が必要なので、単一選択にしておく
-        self.list_widget.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        layout.addWidget(self.list_widget, 1)
+        self._graph_container = _GraphContainer(self)
+        self.scroll_area = QScrollArea(self)
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.scroll_area.setWidget(self._graph_container)
+        layout.addWidget(self.scroll_area, 1)
+
+        # 表示順どおりのグラフ一覧（レイアウト内の並びと常に一致させる）
+        self._graphs: List["_GraphItemWidget"] = []
 
         # 下部: 閉じるボタン
         button_row = QHBoxLayout()
@@ -457,9 +538,19 @@ class SnapshotGraphDialog(QDialog):
         layout.addLayout(button_row)
 
         self._metric_defs: List[_MetricDef] = self._build_metric_defs()
+        # グラフ更新のたびに線形探索しないよう、キーから定義を引ける辞書も持っておく
+        self._metric_by_key: dict[str, _MetricDef] = {m.key: m for m in self._metric_defs}
 
         self._init_dates()
 
+        # QDateEdit のスピン操作などで dateChanged が連続して飛んでくるため、
+        # 少し待ってからまとめて 1 回だけ再描画する
+        self._last_range: Optional[Tuple[date, date]] = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(50)
+        self._update_timer.timeout.connect(self._flush_update)
+
         self.from_date.dateChanged.connect(self._on_controls_changed)
         self.to_date.dateChanged.connect(self._on_controls_changed)
 
@@ -489,9 +580,8 @@ class SnapshotGraphDialog(QDialog):
             self.to_date.setDate(today)
             return
 
-        dt_list = [_parse_snapshot_datetime(s) for s in self._snapshots]
-        d_min = min(dt_list).date()
-        d_max = max(dt_list).date()
+        d_min = min(self._parsed_date.values())
+        d_max = max(self._parsed_date.values())
 
         self.from_date.setDate(QDate(d_min.year, d_min.month, d_min.day))
         self.to_date.setDate(QDate(d_max.year, d_max.month, d_max.day))
@@ -507,8 +597,6 @@ class SnapshotGraphDialog(QDialog):
             return False
 
         try:
-            import json
-
             data = json.loads(path.read_text(encoding="utf-8"))
         except Exception:  # noqa: BLE001
             return False
@@ -540,11 +628,7 @@ class SnapshotGraphDialog(QDialog):
 
         # 一旦グラフを空にしてから再構築する
         # （通常は起動時で空だが、安全のためクリアする）
-        while self.list_widget.count() > 0:
-            item = self.list_widget.takeItem(0)
-            w = self.list_widget.itemWidget(item)
-            if isinstance(w, _GraphItemWidget):
-                w.deleteLater()
+        self._clear_graphs()
 
         added = False
         metric_keys = {m.key for m in self._metric_defs}
@@ -604,80 +688,78 @@ class SnapshotGraphDialog(QDialog):
             _MetricDef("accsaber_reloaded_tech_skill_level", "AccSaber Tech Skill Level", is_int=False),
         ]
 
-        # Stats(ScoreSaber 側) の★別クリア数/クリア率/Avg ACC
-        star_values_ss: List[int] = []
-        seen_stars_ss = set()
+        # 登場する★帯を SS / BL 同時に 1 回の走査で集める
+        stars_ss: set[int] = set()
+        stars_bl: set[int] = set()
         for snap in self._snapshots:
-            for s in snap.star_stats:
-                if s.star not in seen_stars_ss:
-                    seen_stars_ss.add(s.star)
-                    star_values_ss.append(s.star)
-
-        star_values_ss.sort()
-        for star in star_values_ss:
-            prefix = f"SS★{star}"
-            metrics.append(
-                _MetricDef(
-                    f"star_ss_{star}_clear_count",
-                    f"{prefix} Clear Count",
-                    is_int=True,
-                )
-            )
-            metrics.append(
-                _MetricDef(
-                    f"star_ss_{star}_clear_rate",
-                    f"{prefix} Clear Rate (%)",
-                    is_int=False,
-                )
-            )
-            metrics.append(
-                _MetricDef(
-                    f"star_ss_{star}_avg_acc",
-                    f"{prefix} Avg ACC",
-                    is_int=False,
-                )
-            )
+            stars_ss.update(st.star for st in snap.star_stats)
+            stars_bl.update(st.star for st in snap.beatleader_star_stats)
+
+        # Stats(ScoreSaber 側) の★別クリア数/クリア率/Avg ACC
+        for star in sorted(stars_ss):
+            for kind, attr, multiplier, kind_label, is_int in _STAR_METRIC_KINDS:
+                key = f"star_ss_{star}_{kind}"
+                self._star_key_map[key] = (star, attr, multiplier)
+                metrics.append(_MetricDef(key, f"SS★{star} {kind_label}", is_int=is_int))
 
         # Stats(BeatLeader 側) の★別クリア数/クリア率/Avg ACC
-        star_values_bl: List[int] = []
-        seen_stars_bl = set()
-        for snap in self._snapshots:
-            for s in snap.beatleader_star_stats:
-                if s.star not in seen_stars_bl:
-                    seen_stars_bl.add(s.star)
-                    star_values_bl.append(s.star)
-
-        star_values_bl.sort()
-        for star in star_values_bl:
-            prefix = f"BL★{star}"
-            metrics.append(
-                _MetricDef(
-                    f"star_bl_{star}_clear_count",
-                    f"{prefix} Clear Count",
-                    is_int=True,
-                )
-            )
-            metrics.append(
-                _MetricDef(
-                    f"star_bl_{star}_clear_rate",
-                    f"{prefix} Clear Rate (%)",
-                    is_int=False,
-                )
-            )
-            metrics.append(
-                _MetricDef(
-                    f"star_bl_{star}_avg_acc",
-                    f"{prefix} Avg ACC",
-                    is_int=False,
-                )
-            )
+        for star in sorted(stars_bl):
+            for kind, attr, multiplier, kind_label, is_int in _STAR_METRIC_KINDS:
+                key = f"star_bl_{star}_{kind}"
+                self._star_key_map[key] = (star, attr, multiplier)
+                metrics.append(_MetricDef(key, f"BL★{star} {kind_label}", is_int=is_int))
 
         return metrics
 
+    def _metric_series(self, key: str) -> Tuple[List[date], List[Tuple[datetime, float]]]:
+        """key のメトリクスを日付昇順の (日付列, 描画用の点列) として返す。
+
+        初回のみ全スナップショットを走査し、日単位で 1 点に集約した結果をキャッシュする
+        （同じ日のスナップショットが複数ある場合は「その日の最後の値」を採用）。
+        """
+
+        cached = self._series_cache.get(key)
+        if cached is not None:
+            return cached
+
+        star_spec = self._star_key_map.get(key)
+        side = 0 if key.startswith("star_ss_") else 1
+        pairs: List[Tuple[date, float]] = []
+        for snap in self._snapshots:
+            if star_spec is not None:
+                value = _get_star_metric_value(self._star_maps[id(snap)][side], *star_spec)
+            else:
+                value = getattr(snap, key, None)
+            if value is None:
+                continue
+            try:
+                v = float(value)
+            except (TypeError, ValueError):
+                continue
+            pairs.append((self._parsed_date[id(snap)], v))
+
+        # 安定ソートなので同じ日付内は taken_at 順（後ろほど新しい）のまま残る
+        pairs.sort(key=lambda p: p[0])
+        day_values: dict[date, float] = {}
+        for d, v in pairs:
+            # 同じ日付が複数ある場合は、後に来た（より新しい）値で上書きする
+            day_values[d] = v
+        dates = list(day_values)
+        points = [(datetime(d.year, d.month, d.day, 0, 0, 0), v) for d, v in day_values.items()]
+        series = (dates, points)
+        self._series_cache[key] = series
+        return series
+
     def _on_controls_changed(self, *args) -> None:  # noqa: ANN002, ARG002
         # from > to になってしまった場合は、簡易的に調整する
         if self.from_date.date() > self.to_date.date():
             self.to_date.setDate(self.from_date.date())
+        self._update_timer.start()
+
+    def _flush_update(self) -> None:
+        """溜まった期間変更を反映する。前回描画時と同じ期間なら何もしない。"""
+        if self._date_range_py() == self._last_range:
+            return
         self._update_all_charts()
 
     def _date_range_py(self) -> Tuple[date, date]:
@@ -688,16 +770,19 @@ class SnapshotGraphDialog(QDialog):
         return d_from_py, d_to_py
 
     def _graph_widgets(self) -> List["_GraphItemWidget"]:
-        widgets: List["_GraphItemWidget"] = []
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            w = self.list_widget.itemWidget(item)
-            if isinstance(w, _GraphItemWidget):
-                widgets.append(w)
-        return widgets
+        return self._graphs
+
+    def _clear_graphs(self) -> None:
+        """全グラフを破棄する。"""
+        flow = self._graph_container.flow
+        for w in self._graphs:
+            flow.removeWidget(w)
+            w.deleteLater()
+        self._graphs.clear()
 
     def _update_all_charts(self) -> None:
         d_from_py, d_to_py = self._date_range_py()
+        self._last_range = (d_from_py, d_to_py)
         for w in self._graph_widgets():
             w.set_date_range(d_from_py, d_to_py)
 
@@ -710,7 +795,6 @@ class SnapshotGraphDialog(QDialog):
         inverted: bool = False,
         color: Optional[str] = None,
     ) -> None:
-        item = QListWidgetItem(self.list_widget)
         widget = _GraphItemWidget(
             self,
             self._snapshots,
@@ -719,63 +803,36 @@ class SnapshotGraphDialog(QDialog):
             initial_inverted=inverted,
             initial_color=color,
         )
-        item.setSizeHint(widget.sizeHint())
-        self.list_widget.addItem(item)
-        self.list_widget.setItemWidget(item, widget)
+        self._graph_container.flow.addWidget(widget)
+        self._graph_container.flow.relayout()
+        self._graphs.append(widget)
 
         # 現在の期間で初期表示
         d_from_py, d_to_py = self._date_range_py()
         widget.set_date_range(d_from_py, d_to_py)
 
-    def _graph_configs(self) -> List[dict]:
-        """現在のグラフ配置を設定 dict のリストとして取得する（未選択も保持）。"""
-        configs: List[dict] = []
-        for w in self._graph_widgets():
-            configs.append({
-                "metric_key": w._current_metric_key(),
-                "inverted": w._invert_btn.isChecked(),
-                "color": w._color.name(),
-            })
-        return configs
-
-    def _rebuild_graphs(self, configs: List[dict]) -> None:
-        """既存グラフを全て破棄し、configs の順序で作り直す。"""
-        while self.list_widget.count() > 0:
-            item = self.list_widget.takeItem(0)
-            w = self.list_widget.itemWidget(item)
-            if isinstance(w, _GraphItemWidget):
-                w.deleteLater()
-        for c in configs:
-            self._add_graph_internal(
-                metric_key=c.get("metric_key"),
-                inverted=bool(c.get("inverted")),
-                color=c.get("color"),
-            )
-        self._update_all_charts()
-
     def _move_graph(self, src_row: int, dst_row: int) -> None:
         """src_row のグラフを dst_row の位置へ移動する。"""
-        configs = self._graph_configs()
-        n = len(configs)
+        n = len(self._graphs)
         if src_row < 0 or src_row >= n or src_row == dst_row:
             return
-        moved = configs.pop(src_row)
-        if dst_row < 0 or dst_row > len(configs):
-            dst_row = len(configs)
-        configs.insert(dst_row, moved)
-        self._rebuild_graphs(configs)
+        if dst_row < 0 or dst_row >= n:
+            dst_row = n - 1
+        # ウィジェットは作り直さず、並び順だけを入れ替える
+        self._graphs.insert(dst_row, self._graphs.pop(src_row))
+        self._graph_container.flow.move_item(src_row, dst_row)
 
     def _default_layout_size(self) -> QSize:
         """3×3 のグラフが収まるウィンドウサイズを返す。"""
         # グラフ 1 個分のサイズ（既存アイテムがあればそのサイズヒント、無ければ最小値）
-        if self.list_widget.count() > 0:
-            cell = self.list_widget.item(0).sizeHint()
+        if self._graphs:
+            cell = self._graphs[0].sizeHint()
         else:
             cell = QSize(280, 220)
-        spacing = self.list_widget.spacing()
+        spacing = self._graph_container.flow.spacing()
         cols = rows = 3
-        vbar = self.list_widget.verticalScrollBar().sizeHint().width()
-        frame = self.list_widget.frameWidth() * 2
+        vbar = self.scroll_area.verticalScrollBar().sizeHint().width()
+        frame = self.scroll_area.frameWidth() * 2
 
         list_w = cols * cell.width() + (cols + 1) * spacing + frame + vbar
         list_h = rows * cell.height() + (rows + 1) * spacing + frame
@@ -791,19 +848,17 @@ class SnapshotGraphDialog(QDialog):
         self._save_state()
 
     def _remove_graph_widget(self, widget: "_GraphItemWidget") -> None:
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if self.list_widget.itemWidget(item) is widget:
-                self.list_widget.takeItem(i)
-                widget.deleteLater()
-                break
+        if widget not in self._graphs:
+            return
+        self._graph_container.flow.removeWidget(widget)
+        self._graph_container.flow.relayout()
+        self._graphs.remove(widget)
+        widget.deleteLater()
 
     def _save_state(self) -> None:
         """現在の From/To とグラフ配置を設定ファイルに保存する。"""
 
         try:
-            import json
-
             d_from, d_to = self._date_range_py()
             graphs_cfg: list[dict[str, object]] = []
             for w in self._graph_widgets():
@@ -850,10 +905,13 @@ class _GraphItemWidget(QWidget):
     ) -> None:
         super().__init__(dialog)
         self._dialog = dialog
-        self._snapshots = list(snapshots)
-        self._metric_defs = list(metric_defs)
+        # どちらもダイアログが所有するリスト。グラフごとにコピーせず参照を共有する（ここでは変更しないこと）
+        self._snapshots = snapshots
+        self._metric_defs = metric_defs
         self._d_from: Optional[date] = None
         self._d_to: Optional[date] = None
+        # ドラッグでの並べ替え開始判定用（左ボタン押下位置）
+        self._drag_start_pos: Optional[QPoint] = None
 
         # 折れ線の色（保存値があれば復元、無ければ既定の青）
         self._color: QColor = QColor(0, 120, 215)
@@ -916,8 +974,35 @@ class _GraphItemWidget(QWidget):
         if initial_inverted:
             self._invert_btn.setChecked(True)
 
+    def mousePressEvent(self, event) -> None:  # type: ignore[override]
+        # 子ウィジェット（ラベルやグラフ部分）で処理されなかったクリックがここに来る
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._drag_start_pos = event.position().toPoint()
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event) -> None:  # type: ignore[override]
+        start = self._drag_start_pos
+        if (
+            start is None
+            or not (event.buttons() & Qt.MouseButton.LeftButton)
+            or (event.position().toPoint() - start).manhattanLength() < QApplication.startDragDistance()
+        ):
+            super().mouseMoveEvent(event)
+            return
+        self._drag_start_pos = None
+        mime = QMimeData()
+        mime.setData(_GRAPH_DRAG_MIME, b"")
+        drag = QDrag(self)
+        drag.setMimeData(mime)
+        drag.setPixmap(self.grab().scaledToWidth(160, Qt.TransformationMode.SmoothTransformation))
+        drag.exec(Qt.DropAction.MoveAction)
+
+    def mouseReleaseEvent(self, event) -> None:  # type: ignore[override]
+        self._drag_start_pos = None
+        super().mouseReleaseEvent(event)
+
     def sizeHint(self) -> QSize:  # type: ignore[override]
-        # 固定に近い幅・高さを返して、リスト側で横並び・折り返ししやすくする
+        # 固定に近い幅・高さを返して、フローレイアウト側で横並び・折り返ししやすくする
         base = super().sizeHint()
         w = max(base.width(), 280)
         h = max(base.height(), 220)
@@ -969,36 +1054,13 @@ class _GraphItemWidget(QWidget):
         d_from_py = self._d_from
         d_to_py = self._d_to
 
-        # 日単位で 1 点に集約する（同じ日のスナップショットが複数ある場合は「その日の最後の値」を採用）
-        day_values: dict[date, float] = {}
-        for snap in self._snapshots:
-            dt_utc = _parse_snapshot_datetime(snap)
-            d = dt_utc.date()
-            if not (d_from_py <= d <= d_to_py):
-                continue
-
-            if key.startswith("star_ss_"):
-                value = _get_ss_star_metric_value(snap, key)
-            elif key.startswith("star_bl_"):
-                value = _get_bl_star_metric_value(snap, key)
-            else:
-                value = getattr(snap, key, None)
-            if value is None:
-                continue
-            try:
-                v = float(value)
-            except (TypeError, ValueError):
-                continue
-
-            # 同じ日付が複数ある場合は、後に来た（より新しい）値で上書きする
-            day_values[d] = v
-
-        points: List[Tuple[datetime, float]] = []
-        for d, v in sorted(day_values.items(), key=lambda item: item[0]):
-            dt_plot = datetime(d.year, d.month, d.day, 0, 0, 0)
-            points.append((dt_plot, v))
+        # 日単位の集約はキャッシュ側で済んでいるので、期間で切り出すだけでよい
+        dates, series_points = self._dialog._metric_series(key)
+        lo = bisect_left(dates, d_from_py)
+        hi = bisect_right(dates, d_to_py)
+        points = series_points[lo:hi]
 
-        metric_def = next((m for m in self._metric_defs if m.key == key), None)
+        metric_def = self._dialog._metric_by_key.get(key)
         label = metric_def.label if metric_def is not None else key
         y_as_int = bool(metric_def is not None and metric_def.is_int)
 
@@ -1012,4 +1074,5 @@ class _GraphItemWidget(QWidget):
         t_min = datetime(d_from_py.year, d_from_py.month, d_from_py.day, 0, 0, 0)
         t_max = datetime(last_date.year, last_date.month, last_date.day, 0, 0, 0)
 
-        self.chart.set_data(points, label, t_min=t_min, t_max=t_max, y_as_int=y_as_int)
+        # _metric_series の点列は日付昇順なので、チャート側での並べ替えは不要
+        self.chart.set_data(points, label, t_min=t_min, t_max=t_max, y_as_int=y_as_int, presorted=True)
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Optional
 
-from datetime import datetime, timezone
 import json
+import os
 import re
-from PySide6.QtCore import Qt, QTimer, QSize
-from PySide6.QtGui import QColor, QIcon, QPalette
+import threading
+from PySide6.QtCore import QObject, Qt, QTimer, QSize, Signal
+from PySide6.QtGui import QBrush, QColor, QFont, QIcon, QPalette
 from .theme import (
     detect_system_dark,
     label_cell_color,
@@ -43,7 +48,7 @@ from PySide6.QtWidgets import (
     QStyledItemDelegate,
 )
 
-from .snapshot import Snapshot, SNAPSHOT_DIR, BASE_DIR, RESOURCES_DIR
+from .snapshot import Snapshot, SNAPSHOT_DIR, BASE_DIR, RESOURCES_DIR, parse_taken_at
 
 
 def _light_app_button_min_height() -> int:
@@ -52,6 +57,158 @@ def _light_app_button_min_height() -> int:
     return 20 if detect_system_dark() else 23
 
 
+def _round2_value(value: Optional[float], suffix: Optional[str] = None):
+    """_set_row に渡す小数 2 桁の値を作る。None はそのまま None を返す。
+
+    suffix を省略すると丸めた数値のみ（表示は _set_row 側で書式化）、
+    渡すと (丸めた数値, "12.34" + suffix) のタプルを返す。差分は丸めた数値同士で計算される。
+    """
+    if value is None:
+        return None
+    rounded = round(value, 2)
+    if suffix is None:
+        return rounded
+    return rounded, f"{value:.2f}{suffix}"
+
+
+# ★別テーブルで頻出する「ゼロ」表示。データ無しの★帯ごとに同じ文字列を書式化し直さない
+_ZERO_RATE_TEXT = "0 (0.0%)"
+_ZERO_ACC_PAIR = (0, "0.00")
+_ZERO_PP_PAIR = (0, "0")
+
+
+# テーブルセルの文字揃え。セルごとに Qt.AlignmentFlag を引いて OR し直さないよう定数にしておく
+_ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight
+_ALIGN_RIGHT_VCENTER = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+_ALIGN_LEFT_VCENTER = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+# theme の色関数ごと・テーマごとの QBrush。セルの色付けのたびに QColor → QBrush の変換をしないよう使い回す
+_BRUSH_CACHE: dict = {}
+
+
+def _theme_brush(color_fn) -> QBrush:
+    """theme の色関数（diff_positive_bg など）が返す色の QBrush を返す。"""
+    key = (color_fn, is_dark())
+    brush = _BRUSH_CACHE.get(key)
+    if brush is None:
+        brush = _BRUSH_CACHE[key] = QBrush(color_fn())
+    return brush
+
+
+def _diff_bg_brush(diff) -> QBrush:
+    """差分の符号に応じた背景ブラシを返す（プラス=改善 / マイナス=悪化 / ゼロ=変化なし）。"""
+    if diff > 0:
+        return _theme_brush(diff_positive_bg)
+    if diff < 0:
+        return _theme_brush(diff_negative_bg)
+    return _theme_brush(diff_neutral_bg)
+
+
+_NO_BRUSH = QBrush()
+_NO_ICON = QIcon()
+
+
+def _reuse_item(table: QTableWidget, row: int, col: int, text: str) -> QTableWidgetItem:
+    """セルに既にアイテムがあれば見た目をリセットして使い回し、無ければ新しく作って置く。
+
+    行数が変わらないテーブルでは、スナップショットを切り替えるたびに
+    アイテムを作り直さずにテキストと色だけを差し替えられる。
+    """
+    item = table.item(row, col)
+    if item is None:
+        item = QTableWidgetItem(text)
+        table.setItem(row, col, item)
+        return item
+    item.setText(text)
+    item.setBackground(_NO_BRUSH)
+    item.setForeground(_NO_BRUSH)
+    item.setIcon(_NO_ICON)
+    item.setToolTip("")
+    return item
+
+
+@lru_cache(maxsize=None)
+def _service_icon(file_name: str) -> QIcon:
+    """resources 配下のサービスアイコンを返す。ダイアログを開き直しても同じ QIcon を使い回す。"""
+    return QIcon(str(RESOURCES_DIR / file_name))
+
+
+@lru_cache(maxsize=1024)
+def _format_taken_at_local(taken_at: str, fmt: str) -> str:
+    """taken_at(UTC で保存) をローカル時刻に変換して fmt で書式化する。解析できなければ taken_at をそのまま返す。
+
+    コンボの再構築やテーブル更新のたびに同じ taken_at を変換し直さないようキャッシュする。
+    """
+    dt_utc = parse_taken_at(taken_at)
+    if dt_utc is None:
+        return taken_at
+    return dt_utc.astimezone().strftime(fmt)
+
+
+# 国コード → 国旗絵文字。国コードは種類が限られるので一度作った文字列を使い回す
+_FLAG_CACHE: dict[str, str] = {}
+
+
+def _country_flag(code: Optional[str]) -> Optional[str]:
+    """2 文字の国コードを国旗絵文字に変換する。2 文字の英字でなければ大文字化したコードをそのまま返す。"""
+    if not code:
+        return None
+    cc = str(code).upper()
+    flag = _FLAG_CACHE.get(cc)
+    if flag is not None:
+        return flag
+    if len(cc) != 2 or not cc.isalpha():
+        return cc
+    base = ord("🇦")
+    flag = chr(base + (ord(cc[0]) - ord("A"))) + chr(base + (ord(cc[1]) - ord("A")))
+    _FLAG_CACHE[cc] = flag
+    return flag
+
+
+for _cc in ("JP", "US", "KR", "CN", "DE", "FR", "GB"):
+    _country_flag(_cc)
+del _cc
+
+
+# "45.3%" の数値部分を取り出す正規表現（セル表示文字列の解析で繰り返し使う）
+_PERCENT_RE = re.compile(r"([-+]?\d+(?:\.\d+)?)\s*%")
+
+
+def _parse_percent_text(value_str) -> Optional[float]:
+    """"12 (45.3%)" や "95.12%" のような表示文字列から % の数値を取り出す（% が無ければ全体を数値とみなす）。"""
+    if value_str in (None, ""):
+        return None
+    s = str(value_str).strip()
+    m = _PERCENT_RE.search(s)
+    num_str = m.group(1) if m else s
+    try:
+        return float(num_str)
+    except ValueError:
+        return None
+
+
+def _build_bar_gradient_lut() -> "tuple[QColor, ...]":
+    """バー比率 0.0〜1.0 を 256 段階に区切った 赤→黄→緑 グラデーション色の表を作る。"""
+    colors: list[QColor] = []
+    for i in range(256):
+        ratio = i / 255
+        if ratio <= 0.5:
+            t = ratio / 0.5 if ratio > 0 else 0.0
+            r, g, b = 255, int(255 * t), 0
+        elif ratio <= 0.8:
+            t = (ratio - 0.5) / 0.3
+            r, g, b = int(255 * (1.0 - t)), 255, 0
+        else:
+            t = (ratio - 0.8) / 0.2
+            r, g, b = 0, 255, int(255 * t / 2)
+        colors.append(QColor(r, g, b, 180))
+    return tuple(colors)
+
+
+# PercentageBarDelegate のバー色。描画のたびに色を計算しないよう、全デリゲートで共有する
+_BAR_GRADIENT_LUT = _build_bar_gradient_lut()
+
+
 class PercentageBarDelegate(QStyledItemDelegate):
     """パーセンテージ値を持つセルに簡易な横棒グラフを描画するデリゲート。
 
@@ -76,46 +233,39 @@ class PercentageBarDelegate(QStyledItemDelegate):
         self._dark_text_off_bar = dark_text_off_bar
         self._light_text_on_bar = light_text_on_bar
         self._light_text_off_bar = light_text_off_bar
-
-    def _parse_value(self, value_str) -> "Optional[float]":
-        if value_str in (None, ""):
-            return None
-        s = str(value_str).strip()
-        m = re.search(r"([-+]?\d+(?:\.\d+)?)\s*%", s)
-        num_str = m.group(1) if m else s
-        try:
-            return float(num_str)
-        except ValueError:
-            return None
+        # 100% セル用の太字フォント（元フォントの key() ごと）。セルごとに setBold で複製しないよう使い回す
+        self._bold_font_cache: dict[str, QFont] = {}
+
+    def _bold_font(self, font: QFont) -> QFont:
+        """font の太字版を返す（同じフォントに対しては同じ QFont を返す）。"""
+        key = font.key()
+        bold = self._bold_font_cache.get(key)
+        if bold is None:
+            bold = QFont(font)
+            bold.setBold(True)
+            self._bold_font_cache[key] = bold
+        return bold
 
     def _resolve_value(self, index) -> "Optional[float]":
-        """表示テキストまたは UserRole から数値を解決する。"""
-        value = self._parse_value(index.data())
-        if value is None:
-            user_val = index.data(Qt.ItemDataRole.UserRole)
-            if isinstance(user_val, (int, float)):
-                value = float(user_val)
-        return value
-
-    def _compute_bar_rgb(self, value: float) -> "tuple[float, int, int, int]":
-        """value からバー比率と RGB を返す。"""
+        """UserRole または表示テキストから数値を解決する。
+
+        セル作成時に UserRole へ数値を入れておけば、描画のたびに文字列を解析せずに済む。
+        UserRole が無いセルだけ表示テキストを解析する。
+        """
+        user_val = index.data(Qt.ItemDataRole.UserRole)
+        if isinstance(user_val, (int, float)):
+            return float(user_val)
+        return _parse_percent_text(index.data())
+
+    def _compute_bar_color(self, value: float) -> "tuple[float, QColor]":
+        """value からバー比率とバー色（_BAR_GRADIENT_LUT の要素）を返す。"""
         if value <= self._min_value:
             ratio = 0.0
         else:
             span = self._max_value - self._min_value
             ratio = (value - self._min_value) / span if span > 0 else 0.0
         ratio = max(0.0, min(1.0, ratio))
-
-        if ratio <= 0.5:
-            t = ratio / 0.5 if ratio > 0 else 0.0
-            r, g, b = 255, int(255 * t), 0
-        elif ratio <= 0.8:
-            t = (ratio - 0.5) / 0.3
-            r, g, b = int(255 * (1.0 - t)), 255, 0
-        else:
-            t = (ratio - 0.8) / 0.2
-            r, g, b = 0, 255, int(255 * t / 2)
-        return ratio, r, g, b
+        return ratio, _BAR_GRADIENT_LUT[int(ratio * 255 + 0.5)]
 
     def initStyleOption(self, option, index) -> None:  # type: ignore[override]
         super().initStyleOption(option, index)
@@ -123,13 +273,13 @@ class PercentageBarDelegate(QStyledItemDelegate):
         if value is None or not (self._max_value > 0):
             return
 
-        ratio, r, g, b = self._compute_bar_rgb(value)
+        ratio, color = self._compute_bar_color(value)
 
         if value >= self._max_value - 1e-3:
-            option.font.setBold(True)
+            option.font = self._bold_font(option.font)
 
         # バー輝度に応じてテキスト色を決定（super() が setForeground 色で上書いた後に再設定）
-        bar_lum = 0.299 * r + 0.587 * g + 0.114 * b
+        bar_lum = 0.299 * color.red() + 0.587 * color.green() + 0.114 * color.blue()
         # バーが薄いときはテキストを濃く、バーが濃いときはテキストを薄くする。閾値は30%のバー重なりで切り替える。
         use_dark_text = ratio >= 0.3 and bar_lum > 140
         dark = is_dark()
@@ -149,14 +299,13 @@ class PercentageBarDelegate(QStyledItemDelegate):
         if value is None or not (self._max_value > 0):
             return super().paint(painter, option, index)
 
-        ratio, r, g, b = self._compute_bar_rgb(value)
+        ratio, color = self._compute_bar_color(value)
 
         painter.save()
         rect = option.rect.adjusted(1, 1, -1, -1)
         bar_width = int(rect.width() * ratio)
         bar_rect = rect.adjusted(0, 0, bar_width - rect.width(), 0)
 
-        color = QColor(r, g, b if ratio > 0.8 else 0, 180)
         painter.fillRect(bar_rect, color)
         painter.restore()
 
@@ -311,6 +460,187 @@ class ColumnMaxBarDelegate(QStyledItemDelegate):
         super().paint(painter, option, index)
 
 
+# スナップショットの並べ替えキー（lambda より呼び出しが軽い）
+_TAKEN_AT = attrgetter("taken_at")
+
+# 比較ダイアログ上段 Metric テーブルの行定義: (ラベル, 種類, Snapshot から値を取り出す getter)
+#   "plain": 値をそのまま表示 / "acc": 平均精度(%) / "rank": (全体順位, 国コード, 国内順位)
+#   "ranked_plays": (Ranked プレイ数, ★別統計) / "prestige": (Prestige, Lv)
+_SS_METRIC_ROWS = (
+    ("[SS] PP", "plain", attrgetter("scoresaber_pp")),
+    ("[SS] Rank", "rank", attrgetter("scoresaber_rank_global", "scoresaber_country", "scoresaber_rank_country")),
+    ("[SS] Avg Ranked Acc", "acc", attrgetter("scoresaber_average_ranked_acc")),
+    ("[SS] Total Play Count", "plain", attrgetter("scoresaber_total_play_count")),
+    ("[SS] Ranked Play Count", "ranked_plays", attrgetter("scoresaber_ranked_play_count", "star_stats")),
+)
+_BL_METRIC_ROWS = (
+    ("[BL] Prestige", "prestige", attrgetter("beatleader_prestige", "beatleader_level")),
+    ("[BL] PP", "plain", attrgetter("beatleader_pp")),
+    ("[BL] Rank", "rank", attrgetter("beatleader_rank_global", "beatleader_country", "beatleader_rank_country")),
+    ("[BL] Avg Ranked Acc", "acc", attrgetter("beatleader_average_ranked_acc")),
+    ("[BL] Total Play Count", "plain", attrgetter("beatleader_total_play_count")),
+    ("[BL] Ranked Play Count", "ranked_plays", attrgetter("beatleader_ranked_play_count", "beatleader_star_stats")),
+)
+
+# スナップショット読み込み・コンボ構築の経過を print するか（コンソール出力は遅いので普段は出さない）
+_DEBUG_SNAPSHOT_LOAD = False
+
+# snapshots_index.json の形式。形式（保存する項目）を変えたら上げて、古いキャッシュを捨てさせる
+_SNAPSHOT_INDEX_VERSION = 3
+# 比較ダイアログで★別テーブルの行データを保持しておくスナップショット組の数
+_STAR_PLAN_CACHE_SIZE = 8
+
+
+@dataclass(frozen=True)
+class _SnapshotEntry:
+    """コンボの構築・並べ替えに使うスナップショットの概要。本体は選択されたときに path から読む。"""
+
+    path: str
+    steam_id: str
+    taken_at: str
+    scoresaber_name: Optional[str] = None
+    beatleader_name: Optional[str] = None
+
+
+class _SnapshotLoadSignals(QObject):
+    """スナップショット一覧の非同期読み込み完了シグナル。"""
+    loaded = Signal(object)   # dict[str, List[_SnapshotEntry]]
+
+
+def _entry_fields_or_none(path: Path) -> Optional[dict]:
+    """スナップショット JSON を読み、_SnapshotEntry に入れる項目（path 以外）を dict で返す。読めなければ None。"""
+    try:
+        snap = Snapshot.load(path)
+    except Exception:  # noqa: BLE001
+        return None
+    return {
+        "steam_id": snap.steam_id,
+        "taken_at": snap.taken_at,
+        "scoresaber_name": snap.scoresaber_name,
+        "beatleader_name": snap.beatleader_name,
+    }
+
+
+def _load_snapshot_files(paths: List[Path]) -> List[Optional[dict]]:
+    """paths の JSON を並列に読み込んで概要の dict にし、同じ順序で返す（読めなかったものは None）。"""
+
+    # 1 件ずつ順に読むとディスク待ちが積み重なるので、読み込みはプールで重ねる
+    max_workers = min(8, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_entry_fields_or_none, paths))
+
+
+def _snapshot_index_path() -> Path:
+    """スナップショット概要のキャッシュファイルパスを返す。"""
+    return BASE_DIR / "cache" / "snapshots_index.json"
+
+
+def _read_snapshot_index() -> dict[str, list]:
+    """キャッシュ済みの {パス: [mtime_ns, 概要の dict]} を返す。無い・壊れている・形式が古い場合は空。"""
+    try:
+        data = json.loads(_snapshot_index_path().read_bytes())
+    except Exception:  # noqa: BLE001
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _SNAPSHOT_INDEX_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _write_snapshot_index(index: dict[str, list]) -> None:
+    """{パス: [mtime_ns, 概要の dict]} をキャッシュファイルに保存する（一時ファイルに書いてから置き換える）。"""
+    path = _snapshot_index_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": _SNAPSHOT_INDEX_VERSION, "files": index}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        tmp_path.replace(path)
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def _entry_from_index(path: str, fields: object) -> Optional[_SnapshotEntry]:
+    """キャッシュの概要 dict から _SnapshotEntry を作る。形が合わなければ None（読み直し扱い）。"""
+    if not isinstance(fields, dict):
+        return None
+    steam_id = fields.get("steam_id")
+    taken_at = fields.get("taken_at")
+    if not isinstance(steam_id, str) or not isinstance(taken_at, str):
+        return None
+    return _SnapshotEntry(
+        path=path,
+        steam_id=steam_id,
+        taken_at=taken_at,
+        scoresaber_name=fields.get("scoresaber_name"),
+        beatleader_name=fields.get("beatleader_name"),
+    )
+
+
+def _read_snapshots_by_player() -> dict[str, List[_SnapshotEntry]]:
+    """SNAPSHOT_DIR の JSON の概要をすべて集め、steam_id 順の dict に時刻の新しい順で入れて返す。
+
+    前回読み込んだときから更新されていないファイルは読み直さず、キャッシュした概要
+    （steam_id / taken_at / 名前）を使う。スナップショット本体はコンボで選ばれたときに読む。
+    ファイル数に比例して時間がかかるため、UI スレッド以外から呼ぶこと。
+    """
+
+    # print文は日本語で
+    if _DEBUG_SNAPSHOT_LOAD:
+        print("スナップショットを読み込んでいます:", SNAPSHOT_DIR)
+    # 日付の新しい順（降順）で読み込みつつ、プレイヤーごとにグループ化
+    paths: List[Path] = sorted(SNAPSHOT_DIR.glob("*.json"), reverse=True)
+
+    cached_index = _read_snapshot_index()
+    index: dict[str, list] = {}
+    entries: List[Optional[_SnapshotEntry]] = [None] * len(paths)
+    stale: List[int] = []   # 読み直しが必要な paths のインデックス
+    stale_mtimes: List[int] = []
+    for i, path in enumerate(paths):
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        key = str(path)
+        cached = cached_index.get(key)
+        if isinstance(cached, list) and len(cached) == 2 and cached[0] == mtime:
+            entry = _entry_from_index(key, cached[1])
+            if entry is not None:
+                entries[i] = entry
+                index[key] = cached
+                continue
+        stale.append(i)
+        stale_mtimes.append(mtime)
+
+    updated = False
+    if stale:
+        # 読み込み前に取った mtime で記録するので、読み込み中に書き換わったファイルは次回読み直される
+        for i, mtime, fields in zip(stale, stale_mtimes, _load_snapshot_files([paths[i] for i in stale])):
+            if fields is None:
+                continue
+            key = str(paths[i])
+            entries[i] = _entry_from_index(key, fields)
+            index[key] = [mtime, fields]
+            updated = True
+    # 追加・更新・削除されたファイルがあればキャッシュを書き直す（読めないファイルは毎回読み直すだけ）
+    if updated or len(index) != len(cached_index):
+        _write_snapshot_index(index)
+
+    snapshots_by_player: dict[str, List[_SnapshotEntry]] = {}
+    for entry in entries:
+        if entry is None or not entry.steam_id:
+            continue
+        snapshots_by_player.setdefault(entry.steam_id, []).append(entry)
+
+    # 各プレイヤーごとに、時刻の新しい順にソート。
+    # プレイヤーは steam_id 順に並べた dict で返すので、コンボ構築側で並べ直す必要はない
+    for snaps in snapshots_by_player.values():
+        snaps.sort(key=_TAKEN_AT, reverse=True)
+    return {sid: snapshots_by_player[sid] for sid in sorted(snapshots_by_player)}
+
+
 class SnapshotCompareDialog(QDialog):
     """2つのスナップショットを選んで、主要指標の差分を一覧表示するダイアログ。"""
 
@@ -330,8 +660,22 @@ class SnapshotCompareDialog(QDialog):
         self._default_window_size = (1540, 887)
         self.resize(*self._default_window_size)
 
-        # steam_id ごとにスナップショットを管理する
-        self._snapshots_by_player: dict[str, List[Snapshot]] = {}
+        # steam_id ごとにスナップショットの概要を管理する（本体は _snapshot_for で選択時に読む）
+        self._snapshots_by_player: dict[str, List[_SnapshotEntry]] = {}
+        # 読み込み済みのスナップショット本体（パス → Snapshot）。同じ選択で毎回ファイルを読み直さない
+        self._full_snapshots: dict[str, Snapshot] = {}
+        # スナップショットはバックグラウンドで読み込む。読み込み完了（選択状態の復元）までは設定を保存しない
+        self._snapshots_loaded: bool = False
+        # 設定ファイルは開いたときに 1 回だけ読み、以降はこの dict を正として更新・書き出す
+        self._settings_data: dict = self._read_settings() or {}
+        # A/B それぞれで選択中のプレイヤー (steam_id, 新しい順のスナップショット一覧)。
+        # _current_snapshot のたびにコンボの itemData を引かないよう、_reload_player_snapshots_for で更新する
+        self._cached_a: Optional[tuple[str, List[_SnapshotEntry]]] = None
+        self._cached_b: Optional[tuple[str, List[_SnapshotEntry]]] = None
+        # (id(snap_a), id(snap_b)) → (snap_a, snap_b, ★別テーブルの行データ)。最近使った順に並べる
+        self._star_plan_cache: dict[tuple[int, int], tuple[Snapshot, Snapshot, tuple]] = {}
+        self._load_signals = _SnapshotLoadSignals()
+        self._load_signals.loaded.connect(self._on_snapshots_loaded)
         # Stats 画面側から渡された「最初に選択しておきたいプレイヤー」
         self._initial_steam_id: Optional[str] = initial_steam_id
         # Metric 列の幅の非表示から復帰用(ここで左端の Metric 列の幅を固定値で保持しておく)
@@ -349,12 +693,6 @@ class SnapshotCompareDialog(QDialog):
         root_layout.setContentsMargins(2, 2, 2, 2)
         root_layout.setSpacing(0)
 
-        # サービス別アイコン
-        resources_dir = RESOURCES_DIR
-        self._icon_scoresaber = QIcon(str(resources_dir / "scoresaber_logo.svg"))
-        self._icon_beatleader = QIcon(str(resources_dir / "beatleader_logo.webp"))
-        self._icon_accsaber = QIcon(str(resources_dir / "asssaber_logo.webp"))
-
         # 上部: 左右プレイヤー選択 + それぞれのスナップショット日時選択
         top_grid = QGridLayout()
         top_grid.setAlignment(Qt.AlignmentFlag.AlignLeft)
@@ -587,6 +925,8 @@ class SnapshotCompareDialog(QDialog):
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.Interactive)
+        # ResizeToContents 列の幅計算で全行を走査しないよう、表示中の行＋α だけで測る
+        header.setResizeContentsPrecision(10)
         header.resizeSection(0, 96)
         header.resizeSection(1, 150)
         header.resizeSection(2, 85)
@@ -621,6 +961,7 @@ class SnapshotCompareDialog(QDialog):
         header_acc.setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)
         header_acc.setSectionResizeMode(3, QHeaderView.ResizeMode.Interactive)
         header_acc.setSectionResizeMode(4, QHeaderView.ResizeMode.Interactive)
+        header_acc.setResizeContentsPrecision(10)
         header_acc.resizeSection(0, 96)
         header_acc.resizeSection(1, 150)
         header_acc.resizeSection(2, 85)
@@ -684,6 +1025,7 @@ class SnapshotCompareDialog(QDialog):
         ss_star_header.setSectionResizeMode(9,  QHeaderView.ResizeMode.ResizeToContents)
         ss_star_header.setSectionResizeMode(13, QHeaderView.ResizeMode.ResizeToContents)
         ss_star_header.setSectionResizeMode(16, QHeaderView.ResizeMode.ResizeToContents)
+        ss_star_header.setResizeContentsPrecision(10)
         ss_star_header.resizeSection(0, 35)
         ss_star_header.resizeSection(1, 90)
         ss_star_header.resizeSection(2, 90)
@@ -745,6 +1087,7 @@ class SnapshotCompareDialog(QDialog):
         bl_star_header.setSectionResizeMode(9,  QHeaderView.ResizeMode.ResizeToContents)
         bl_star_header.setSectionResizeMode(13, QHeaderView.ResizeMode.ResizeToContents)
         bl_star_header.setSectionResizeMode(16, QHeaderView.ResizeMode.ResizeToContents)
+        bl_star_header.setResizeContentsPrecision(10)
         bl_star_header.resizeSection(0, 35)
         bl_star_header.resizeSection(1, 90)
         bl_star_header.resizeSection(2, 90)
@@ -795,6 +1138,7 @@ class SnapshotCompareDialog(QDialog):
             _acc_h.setSectionResizeMode(_c, QHeaderView.ResizeMode.ResizeToContents)
         for _c in (1, 2, 4, 5, 7, 8, 10, 11, 13, 14):
             _acc_h.setSectionResizeMode(_c, QHeaderView.ResizeMode.Interactive)
+        _acc_h.setResizeContentsPrecision(10)
         _acc_h.resizeSection(0, 68)
         # A/B 値列の初期幅（コンテンツ幅より少し広め）
         for _c in (1, 2):   # A AP / B AP
@@ -868,14 +1212,22 @@ class SnapshotCompareDialog(QDialog):
         self._star_hsplitter.setSizes([392, 485])
         self._metric_vsplitter.setSizes([367, 436])
 
-        self._load_snapshots()
-        # Stats 画面から steam_id が渡されている場合はそちらを優先し、
-        # そのプレイヤーについて「最後に選択していたスナップショット日付」を復元する。
-        # steam_id が渡されていない場合のみ、従来通りダイアログ全体の前回状態を復元する。
-        if self._initial_steam_id is None:
-            self._restore_last_selection()
-        else:
-            self._restore_last_selection_for_player(self._initial_steam_id)
+        # プレイヤー変更→スナップショット一覧の作り直し、のように選択変更のシグナルは連続して飛んでくるため、
+        # テーブル更新はイベントループに戻ってから 1 回だけ、設定ファイルへの書き出しは操作が落ち着いてから 1 回だけ行う
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._update_view2)
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_settings)
+
+        # トグル・列表示・スプリッター・ウィンドウサイズは表示前に復元しておく。
+        # スナップショットの読み込み完了を待つと、表示済みのウィンドウが後から跳ねたり、
+        # 読み込み中に変えたトグルが上書きされたりするため。選択状態の復元だけは読み込み後に行う
+        if self._settings_data:
+            self._restore_ui_state(self._settings_data)
 
         # 設定ファイルが存在しない場合のデフォルト可視状態を保証する
         # （_restore_ui_state が呼ばれた場合は QTimer で上書きされる）
@@ -908,45 +1260,94 @@ class SnapshotCompareDialog(QDialog):
         self._metric_vsplitter.splitterMoved.connect(lambda *_: self._save_last_selection())
 
         self._apply_row_height()
+        # 読み込み完了までは空のテーブルで表示しておき、完了後に _on_snapshots_loaded で埋める
         self._update_view2()
         if not self._ui_state_restored:
             QTimer.singleShot(0, self._apply_default_layout_initial_geometry)
+        self._load_snapshots()
 
     # -------------------- internal helpers --------------------
 
+    # サービス別アイコン（初めて使うときに読み込む）
+    @cached_property
+    def _icon_scoresaber(self) -> QIcon:
+        return _service_icon("scoresaber_logo.svg")
+
+    @cached_property
+    def _icon_beatleader(self) -> QIcon:
+        return _service_icon("beatleader_logo.webp")
+
+    @cached_property
+    def _icon_accsaber(self) -> QIcon:
+        return _service_icon("asssaber_logo.webp")
+
+    @cached_property
+    def _icon_prefix_map(self) -> dict[str, QIcon]:
+        """_set_row でラベル先頭の "[SS] " などからアイコンを引くための対応表（プレフィックスは 5 文字固定）。"""
+        return {
+            "[SS] ": self._icon_scoresaber,
+            "[BL] ": self._icon_beatleader,
+            "[AS] ": self._icon_accsaber,
+        }
+
     def _load_snapshots(self) -> None:
-        """snapshots ディレクトリから JSON を読み込んでコンボに並べる。"""
+        """スナップショットの読み込みをバックグラウンドで開始する（完了後に _on_snapshots_loaded が呼ばれる）。"""
+
+        signals = self._load_signals
+
+        def _worker() -> None:
+            try:
+                snapshots_by_player = _read_snapshots_by_player()
+            except Exception:  # noqa: BLE001
+                snapshots_by_player = {}
+            signals.loaded.emit(snapshots_by_player)
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _on_snapshots_loaded(self, snapshots_by_player: dict) -> None:
+        """読み込んだスナップショットでコンボを構築し、前回の選択状態を復元して表示を更新する。
+
+        UI 状態（トグル・スプリッター等）は __init__ で復元済みなので、ここではプレイヤー/スナップショットの選択だけを扱う。
+        """
+
+        combos = (self.combo_player_a, self.combo_player_b, self.combo_a, self.combo_b)
+        # 構築・復元中の currentIndexChanged で都度テーブル更新・設定保存が走らないよう止めておく
+        for combo in combos:
+            combo.blockSignals(True)
+        try:
+            self._populate_player_combos(snapshots_by_player)
+            # Stats 画面から steam_id が渡されている場合はそちらを優先し、
+            # そのプレイヤーについて「最後に選択していたスナップショット日付」を復元する。
+            # steam_id が渡されていない場合のみ、従来通りダイアログ全体の前回状態を復元する。
+            if self._initial_steam_id is None:
+                self._restore_last_selection()
+            else:
+                self._restore_last_selection_for_player(self._initial_steam_id)
+        finally:
+            for combo in combos:
+                combo.blockSignals(False)
+        self._snapshots_loaded = True
+        self._update_view2()
+
+    def _populate_player_combos(self, snapshots_by_player: dict[str, List[_SnapshotEntry]]) -> None:
+        """読み込み済みのスナップショットをプレイヤー/スナップショットのコンボに並べる。"""
         self.combo_player_a.clear()
         self.combo_player_b.clear()
         self.combo_a.clear()
         self.combo_b.clear()
-        self._snapshots_by_player.clear()
-        
-        # print文は日本語で
-        print("スナップショットを読み込んでいます:", SNAPSHOT_DIR)
-        # 日付の新しい順（降順）で読み込みつつ、プレイヤーごとにグループ化
-        paths: List[Path] = sorted(SNAPSHOT_DIR.glob("*.json"), reverse=True)
-        for path in paths:
-            try:
-                snap = Snapshot.load(path)
-            except Exception:
-                continue
+        self._cached_a = None
+        self._cached_b = None
+        self._star_plan_cache.clear()
+        self._full_snapshots.clear()
+        self._snapshots_by_player = snapshots_by_player
 
-            sid = snap.steam_id
-            if not sid:
-                continue
-            self._snapshots_by_player.setdefault(sid, []).append(snap)
-
-        # 各プレイヤーごとに、時刻の新しい順にソート
+        # プレイヤー選択コンボを構築（最新スナップショットの名前を使う）。steam_id 順に並べ済み
         for sid, snaps in self._snapshots_by_player.items():
-            snaps.sort(key=lambda s: s.taken_at, reverse=True)
-
-        # プレイヤー選択コンボを構築（最新スナップショットの名前を使う）
-        for sid, snaps in sorted(self._snapshots_by_player.items()):
             latest = snaps[0]
-            print("最新のスナップショット (プレイヤー):", sid, latest.taken_at)
             name = latest.scoresaber_name or latest.beatleader_name or ""
-            print("プレイヤーをコンボに追加:", sid, name)
+            if _DEBUG_SNAPSHOT_LOAD:
+                print("最新のスナップショット (プレイヤー):", sid, latest.taken_at)
+                print("プレイヤーをコンボに追加:", sid, name)
             if name:
                 label = f"{name} ({sid})"
             else:
@@ -998,16 +1399,21 @@ class SnapshotCompareDialog(QDialog):
         cache_dir = BASE_DIR / "cache"
         return cache_dir / "snapshot_compare.json"
 
-    def _restore_last_selection_for_player(self, steam_id: str) -> None:
-        """指定プレイヤーについて、最後に選択していたスナップショット日付を復元する。"""
+    def _read_settings(self) -> Optional[dict]:
+        """設定ファイルを読み込んで返す。存在しない・壊れている場合は None。"""
 
         path = self._settings_path()
-        if not path.exists():
-            return
-
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = json.loads(path.read_bytes())
         except Exception:  # noqa: BLE001
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _restore_last_selection_for_player(self, steam_id: str) -> None:
+        """指定プレイヤーについて、最後に選択していたスナップショット日付を復元する。"""
+
+        data = self._settings_data
+        if not data:
             return
 
         per_player = data.get("per_player")
@@ -1040,18 +1446,12 @@ class SnapshotCompareDialog(QDialog):
 
         _apply_snapshot_selection(self.combo_a, snap_a_taken_at)
         _apply_snapshot_selection(self.combo_b, snap_b_taken_at)
-        self._restore_ui_state(data)
 
     def _restore_last_selection(self) -> None:
         """前回のプレイヤー/スナップショット選択状態を可能な範囲で復元する。"""
 
-        path = self._settings_path()
-        if not path.exists():
-            return
-
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except Exception:  # noqa: BLE001
+        data = self._settings_data
+        if not data:
             return
 
         # 旧フォーマット（player_a / snapshot_a_taken_at ...）を優先して扱う。
@@ -1100,7 +1500,6 @@ class SnapshotCompareDialog(QDialog):
 
         _select_player_and_snapshot(self.combo_player_a, self.combo_a, player_a_id, snap_a_taken_at)
         _select_player_and_snapshot(self.combo_player_b, self.combo_b, player_b_id, snap_b_taken_at)
-        self._restore_ui_state(data)
 
     def _restore_ui_state(self, data: dict) -> None:
         """JSON data からトグル/チェックボックスの状態を復元する。"""
@@ -1183,20 +1582,18 @@ class SnapshotCompareDialog(QDialog):
         self._apply_star_col_visibility_inner()
 
     def _save_last_selection(self) -> None:
-        """現在のプレイヤー/スナップショット選択状態と UI 状態を設定ファイルに保存する。"""
+        """現在のプレイヤー/スナップショット選択状態と UI 状態を設定に反映し、ファイルへの書き出しを予約する。"""
 
-        snap_a = self._current_snapshot(self.combo_a)
-        snap_b = self._current_snapshot(self.combo_b)
+        # UI 状態は __init__ で復元済みなので読み込み中でも保存する。
+        # 選択状態は読み込み完了（前回の選択の復元）までは保存せず、前回の値を残しておく
+        if self._snapshots_loaded:
+            snap_a = self._current_snapshot(self.combo_a)
+            snap_b = self._current_snapshot(self.combo_b)
+        else:
+            snap_a = snap_b = None
 
-        path = self._settings_path()
         try:
-            if path.exists():
-                try:
-                    data = json.loads(path.read_text(encoding="utf-8"))
-                except Exception:  # noqa: BLE001
-                    data = {}
-            else:
-                data = {}
+            data = self._settings_data
 
             # UI 状態（トグルボタン・チェックボックス）を常に保存
             data["ui_acc_position"]   = self._acc_position
@@ -1235,8 +1632,7 @@ class SnapshotCompareDialog(QDialog):
 
             # スナップショット未選択の場合は UI 状態のみ保存して終了
             if snap_a is None and snap_b is None:
-                path.parent.mkdir(parents=True, exist_ok=True)
-                path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+                self._save_timer.start()
                 return
 
             # 互換性のため、従来のトップレベル情報も更新しておく
@@ -1266,47 +1662,51 @@ class SnapshotCompareDialog(QDialog):
                     entry = {}
                 entry["snapshot_b_taken_at"] = snap_b.taken_at
                 per_player[snap_b.steam_id] = entry
+        except Exception:  # noqa: BLE001
+            # 設定保存失敗はアプリ動作に影響させない
+            return
+        self._save_timer.start()
 
+    def _flush_settings(self) -> None:
+        """メモリ上の設定を設定ファイルに書き出す（一時ファイルに書いてから置き換える）。"""
+
+        path = self._settings_path()
+        try:
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(self._settings_data, ensure_ascii=False, indent=2), encoding="utf-8")
+            tmp_path.replace(path)
         except Exception:  # noqa: BLE001
             # 設定保存失敗はアプリ動作に影響させない
             return
 
+    def _flush_pending_settings(self) -> None:
+        """書き出し待ちの設定があれば、すぐに設定ファイルへ書き出す。"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._flush_settings()
+
     def _reload_player_snapshots_for(self, player_combo: QComboBox, snap_combo: QComboBox) -> None:
         """指定プレイヤーのスナップショット一覧を指定プルダウンに反映する。"""
 
-        snap_combo.clear()
-
         data = player_combo.currentData()
         sid = data if isinstance(data, str) else None
-        if not sid:
-            return
+        snaps = (self._snapshots_by_player.get(sid) or []) if sid else []
+        # clear()/addItem() で飛ぶ currentIndexChanged から _current_snapshot が呼ばれるので、先に更新しておく
+        cached = (sid, snaps) if sid else None
+        if snap_combo is self.combo_a:
+            self._cached_a = cached
+        elif snap_combo is self.combo_b:
+            self._cached_b = cached
+
+        snap_combo.clear()
 
-        snaps = self._snapshots_by_player.get(sid) or []
         if not snaps:
             return
 
-        # taken_at は UTC(Z) で保存しているので、ローカル時刻に変換して表示する
-        def _format_label(snap: Snapshot) -> str:
-            """スナップショットの表示ラベル（日時のみ）を生成する。"""
-
-            taken_text = snap.taken_at
-            try:
-                t_str = snap.taken_at
-                if t_str.endswith("Z"):
-                    t_str = t_str[:-1]
-                    dt_utc = datetime.fromisoformat(t_str).replace(tzinfo=timezone.utc)
-                else:
-                    dt_utc = datetime.fromisoformat(t_str).replace(tzinfo=timezone.utc)
-                dt_local = dt_utc.astimezone()
-                taken_text = dt_local.strftime("%Y-%m-%d %H:%M:%S")
-            except Exception:
-                taken_text = snap.taken_at
-            return taken_text
-
+        # taken_at は UTC(Z) で保存しているので、ローカル時刻に変換して表示する（ラベルは日時のみ）
         for snap in snaps:
-            label = _format_label(snap)
+            label = _format_taken_at_local(snap.taken_at, "%Y-%m-%d %H:%M:%S")
             snap_combo.addItem(label)
 
         # デフォルトでは最新のスナップショットを選択
@@ -1315,20 +1715,20 @@ class SnapshotCompareDialog(QDialog):
 
     def _on_player_a_changed(self, index: int) -> None:  # noqa: ARG002
         self._reload_player_snapshots_for(self.combo_player_a, self.combo_a)
-        self._update_view2()
+        self._update_timer.start()
         self._save_last_selection()
 
     def _on_player_b_changed(self, index: int) -> None:  # noqa: ARG002
         self._reload_player_snapshots_for(self.combo_player_b, self.combo_b)
-        self._update_view2()
+        self._update_timer.start()
         self._save_last_selection()
 
     def _on_snapshot_a_changed(self, index: int) -> None:  # noqa: ARG002
-        self._update_view2()
+        self._update_timer.start()
         self._save_last_selection()
 
     def _on_snapshot_b_changed(self, index: int) -> None:  # noqa: ARG002
-        self._update_view2()
+        self._update_timer.start()
         self._save_last_selection()
 
     def _on_select_latest_b(self) -> None:
@@ -1336,13 +1736,11 @@ class SnapshotCompareDialog(QDialog):
 
         if self.combo_b.count() == 0:
             return
-        # インデックス 0 には常に最新スナップショットを並べている想定
+        # インデックス 0 には常に最新スナップショットを並べている想定。
+        # 切り替わった場合の表示更新・保存は currentIndexChanged 側で行われ、
+        # 既に最新が選択済みの場合は選択が変わらないので何もしない
         if self.combo_b.currentIndex() != 0:
             self.combo_b.setCurrentIndex(0)
-        else:
-            # 既に最新が選択済みの場合は明示的に更新だけ行う
-            self._update_view2()
-            self._save_last_selection()
 
     def _apply_row_height(self) -> None:
         """全テーブルの行高を self._row_height に統一して適用する。"""
@@ -1478,8 +1876,14 @@ class SnapshotCompareDialog(QDialog):
     def closeEvent(self, event) -> None:  # type: ignore[override]
         """ダイアログを閉じる前に現在の状態を保存する。"""
         self._save_last_selection()
+        self._flush_pending_settings()
         super().closeEvent(event)
 
+    def done(self, result: int) -> None:  # type: ignore[override]
+        # 書き出し待ちの設定があれば、閉じる前に書き出しておく
+        self._flush_pending_settings()
+        super().done(result)
+
     def _apply_star_col_visibility(self, *_) -> None:
         """Clear/FC/Acc/PP/SPP 列グループの表示/非表示を SS/BL 両テーブルに適用する。"""
         self._save_last_selection()
@@ -1588,23 +1992,32 @@ class SnapshotCompareDialog(QDialog):
                 self._right_vsplitter.setSizes([rv_total, 0])
 
     def _current_snapshot(self, combo: QComboBox) -> Optional[Snapshot]:
-        # A/B それぞれに対応するプレイヤーコンボから現在のプレイヤーを取得
+        # A/B それぞれで選択中のプレイヤーのスナップショット一覧（_reload_player_snapshots_for で更新）
         if combo is self.combo_a:
-            player_combo = self.combo_player_a
+            cached = self._cached_a
         elif combo is self.combo_b:
-            player_combo = self.combo_player_b
+            cached = self._cached_b
         else:
             return None
 
-        data = player_combo.currentData()
-        sid = data if isinstance(data, str) else None
-        if not sid:
+        if cached is None:
             return None
-        snaps = self._snapshots_by_player.get(sid) or []
+        snaps = cached[1]
         idx = combo.currentIndex()
         if idx < 0 or idx >= len(snaps):
             return None
-        return snaps[idx]
+        return self._snapshot_for(snaps[idx])
+
+    def _snapshot_for(self, entry: _SnapshotEntry) -> Optional[Snapshot]:
+        """概要に対応するスナップショット本体を返す（初回だけファイルから読む）。読めなければ None。"""
+        snap = self._full_snapshots.get(entry.path)
+        if snap is None:
+            try:
+                snap = Snapshot.load(Path(entry.path))
+            except Exception:  # noqa: BLE001
+                return None
+            self._full_snapshots[entry.path] = snap
+        return snap
 
     def _set_row(self, table: QTableWidget, row: int, label: str, a, b) -> None:  # type: ignore[name-defined]
         """指定テーブルの1行分の値と差分を設定する。
@@ -1619,31 +2032,31 @@ class SnapshotCompareDialog(QDialog):
         10 同士の差分を計算できる。
         """
 
-        while table.rowCount() <= row:
-            table.insertRow(table.rowCount())
+        # 行数が足りない場合だけまとめて広げる（★テーブルのように呼び出し側で先に行数を確保していれば何もしない）
+        if table.rowCount() <= row:
+            table.setRowCount(row + 1)
 
         # ラベル先頭の [SS]/[BL]/[AS] をアイコン＋テキストに展開
         original_label = label
-        icon = None
-        text = label
-        if label.startswith("[SS] "):
-            icon = self._icon_scoresaber
-            text = label[len("[SS] "):]
-        elif label.startswith("[BL] "):
-            icon = self._icon_beatleader
-            text = label[len("[BL] "):]
-        elif label.startswith("[AS] "):
-            icon = self._icon_accsaber
-            text = label[len("[AS] "):]
-
-        item_grp = QTableWidgetItem("")
-        item_grp.setBackground(label_cell_color())
-        table.setItem(row, 0, item_grp)
-
-        item0 = QTableWidgetItem(text)
-        item0.setBackground(label_cell_color())
-        item0.setForeground(label_cell_text_color())
-        table.setItem(row, 1, item0)
+        icon = self._icon_prefix_map.get(label[:5])
+        text = label[5:] if icon is not None else label
+
+        # 既存アイテムがあれば使い回す（メイン指標テーブルは行数固定なので作り直さない）
+        label_bg = _theme_brush(label_cell_color)
+        item_grp = _reuse_item(table, row, 0, "")
+        item_grp.setBackground(label_bg)
+
+        item0 = _reuse_item(table, row, 1, text)
+        item0.setBackground(label_bg)
+        item0.setForeground(_theme_brush(label_cell_text_color))
+
+        # 両方とも値が無い行（AccSaber 未登録など）は空セルを置くだけで済ませる。
+        # 行を詰めるとグループのスパンや固定行数とずれるので、行自体は残す。
+        if a is None and b is None:
+            _reuse_item(table, row, 2, "")
+            _reuse_item(table, row, 3, "")
+            _reuse_item(table, row, 4, "")
+            return
 
         def _extract(value):
             # (numeric_value, display_text[, extra_numeric, extra_label]) 形式を解釈する
@@ -1665,11 +2078,11 @@ class SnapshotCompareDialog(QDialog):
         a_numeric, text_a, a_extra_numeric, a_extra_label = _extract(a)
         b_numeric, text_b, b_extra_numeric, b_extra_label = _extract(b)
 
-        table.setItem(row, 2, QTableWidgetItem(text_a))
-        table.setItem(row, 3, QTableWidgetItem(text_b))
+        _reuse_item(table, row, 2, text_a)
+        _reuse_item(table, row, 3, text_b)
 
-        diff_item = QTableWidgetItem("")
-        # diff_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        diff_item = _reuse_item(table, row, 4, "")
+        # diff_item.setTextAlignment(_ALIGN_RIGHT_VCENTER)
         if isinstance(a_numeric, (int, float)) and isinstance(b_numeric, (int, float)):
             # Rank 系の指標は「数値が小さいほど良い」ので符号を反転させる。
             # 例: ランクが 1000 → 900 に改善した場合、+100 として扱う。
@@ -1696,52 +2109,53 @@ class SnapshotCompareDialog(QDialog):
             if color_metric == 0 and isinstance(extra_diff, (int, float)):
                 color_metric = extra_diff
 
-            if color_metric > 0:
-                color = diff_positive_bg()
-            elif color_metric < 0:
-                color = diff_negative_bg()
-            else:
-                color = diff_neutral_bg()
-            diff_item.setBackground(color)
-            diff_item.setForeground(diff_text_color())
-
-        table.setItem(row, 4, diff_item)
+            diff_item.setBackground(_diff_bg_brush(color_metric))
+            diff_item.setForeground(_theme_brush(diff_text_color))
 
     def _update_view2(self) -> None:
-        """スナップショット比較テーブルを更新する（新実装）。"""
+        """スナップショット比較テーブルを更新する（新実装）。
+
+        セルを 1 つ設定するたびに再描画・ソート・シグナル通知が走らないよう、
+        更新中は各テーブルのそれらを止めておき、最後にまとめて反映する。
+        """
+
+        tables = (self.table, self.table_acc, self.ss_star_table, self.bl_star_table, self.acc_cmp_table)
+        sorting = [t.isSortingEnabled() for t in tables]
+        for t in tables:
+            t.setUpdatesEnabled(False)
+            t.setSortingEnabled(False)
+            t.blockSignals(True)
+        try:
+            self._update_view2_inner()
+        finally:
+            for t, was_sorting in zip(tables, sorting):
+                t.blockSignals(False)
+                t.setSortingEnabled(was_sorting)
+                t.setUpdatesEnabled(True)
+
+    def _update_view2_inner(self) -> None:
+        """_update_view2 の本体。各テーブルの内容を実際に作り直す。"""
 
         snap_a = self._current_snapshot(self.combo_a)
         snap_b = self._current_snapshot(self.combo_b)
-        self.table.setRowCount(0)
+        # メイン指標テーブル (self.table) は行構成が毎回同じなので、ここでは消さずに
+        # _set_row で既存アイテムを書き換える。比較できないときだけ空にする。
+        if snap_a is None or snap_b is None:
+            self.table.setRowCount(0)
         self.table_acc.setRowCount(0)
         self.ss_star_table.setRowCount(0)
         self.bl_star_table.setRowCount(0)
         # setRowCount(0) で垂直ヘッダの設定がリセットされるため再適用する
         self._apply_row_height()
-        # AccSaber 比較グリッドのデータをクリア
-        for _r in range(4):
-            for _c in range(16):
-                self.acc_cmp_table.setItem(_r, _c, QTableWidgetItem(""))
+        # AccSaber 比較グリッドのデータをクリア（空アイテムを 4x16 個作り直さず、セルを空にするだけ）
+        self.acc_cmp_table.clearContents()
 
         if snap_a is None or snap_b is None:
             return
 
         # A / B 列ヘッダにスナップショット日付+時刻を含める（例: A (2026/01/11 13:45)）
-        def _date_only(taken_at: str) -> str:
-            try:
-                t_str = taken_at
-                if t_str.endswith("Z"):
-                    t_str = t_str[:-1]
-                    dt_utc = datetime.fromisoformat(t_str).replace(tzinfo=timezone.utc)
-                else:
-                    dt_utc = datetime.fromisoformat(t_str).replace(tzinfo=timezone.utc)
-                dt_local = dt_utc.astimezone()
-                return dt_local.strftime("%Y/%m/%d %H:%M")
-            except Exception:
-                return taken_at
-
-        date_a = _date_only(snap_a.taken_at)
-        date_b = _date_only(snap_b.taken_at)
+        date_a = _format_taken_at_local(snap_a.taken_at, "%Y/%m/%d %H:%M")
+        date_b = _format_taken_at_local(snap_b.taken_at, "%Y/%m/%d %H:%M")
 
         # プレイヤー名（SteamIDなし）
         def _player_name(snap) -> str:
@@ -1858,15 +2272,6 @@ class SnapshotCompareDialog(QDialog):
 
         # 上段: Player / Acc / AccSaber 系の指標
 
-        def _country_flag(code: Optional[str]) -> Optional[str]:
-            if not code:
-                return None
-            cc = str(code).upper()
-            if len(cc) != 2 or not cc.isalpha():
-                return cc
-            base = ord("🇦")
-            return chr(base + (ord(cc[0]) - ord("A"))) + chr(base + (ord(cc[1]) - ord("A")))
-
         def _format_rank_cell(global_rank: Optional[int], country_code: Optional[str], country_rank: Optional[int]) -> Optional[str]:
             if global_rank is None and (country_code is None or country_rank is None):
                 return None
@@ -1928,85 +2333,27 @@ class SnapshotCompareDialog(QDialog):
 
                 diff_item.setText(diff_text)
                 # _set_row でつけた色をランク方向で上書き（小さいほど良い指標なので反転）
-                if diff_global_signed > 0:
-                    diff_item.setBackground(diff_positive_bg())
-                elif diff_global_signed < 0:
-                    diff_item.setBackground(diff_negative_bg())
-                else:
-                    diff_item.setBackground(diff_neutral_bg())
-                diff_item.setForeground(diff_text_color())
+                diff_item.setBackground(_diff_bg_brush(diff_global_signed))
+                diff_item.setForeground(_theme_brush(diff_text_color))
 
             return row + 1
 
+        # 行数は行定義から決まるので、1 行ずつ増やさずに先に確保しておく
+        self.table.setRowCount(len(_SS_METRIC_ROWS) + len(_BL_METRIC_ROWS))
         row_main = 0
 
-        # SS / BL Ranked Play Count の母数（star_stats の map_count 合計）
-        _ss_ranked_total_a = sum(s.map_count for s in (snap_a.star_stats or []))
-        _ss_ranked_total_b = sum(s.map_count for s in (snap_b.star_stats or []))
-        _bl_ranked_total_a = sum(getattr(s, "map_count", 0) for s in (snap_a.beatleader_star_stats or []))
-        _bl_ranked_total_b = sum(getattr(s, "map_count", 0) for s in (snap_b.beatleader_star_stats or []))
+        def _ranked_play_val(plays: "Optional[int]", star_stats) -> "tuple[Optional[int], str] | None":
+            """(numeric, 'plays/total') タプルを返す。plays が None なら None。
 
-        def _ranked_play_val(plays: "Optional[int]", total: int) -> "tuple[Optional[int], str] | None":
-            """(numeric, 'plays/total') タプルを返す。plays が None なら None。"""
+            母数は star_stats の map_count 合計（Ranked 譜面数）。
+            """
             if plays is None:
                 return None
+            total = sum(s.map_count for s in (star_stats or []))
             if total > 0:
                 return (plays, f"{plays:,}/{total:,}")
             return (plays, f"{plays:,}")
 
-        # ScoreSaber
-        _ss_grp_start = row_main
-        self._set_row(self.table, row_main, "[SS] PP", snap_a.scoresaber_pp, snap_b.scoresaber_pp)
-        row_main += 1
-
-        row_main = _set_combined_rank_row(
-            row_main,
-            "[SS] Rank",
-            snap_a.scoresaber_rank_global,
-            snap_a.scoresaber_country,
-            snap_a.scoresaber_rank_country,
-            snap_b.scoresaber_rank_global,
-            snap_b.scoresaber_country,
-            snap_b.scoresaber_rank_country,
-        )
-
-        self._set_row(
-            self.table,
-            row_main,
-            "[SS] Avg Ranked Acc",
-            (round(snap_a.scoresaber_average_ranked_acc, 2), f"{snap_a.scoresaber_average_ranked_acc:.2f}%") if snap_a.scoresaber_average_ranked_acc is not None else None,
-            (round(snap_b.scoresaber_average_ranked_acc, 2), f"{snap_b.scoresaber_average_ranked_acc:.2f}%") if snap_b.scoresaber_average_ranked_acc is not None else None,
-        )
-        row_main += 1
-
-        self._set_row(
-            self.table,
-            row_main,
-            "[SS] Total Play Count",
-            snap_a.scoresaber_total_play_count,
-            snap_b.scoresaber_total_play_count,
-        )
-        row_main += 1
-
-        self._set_row(
-            self.table,
-            row_main,
-            "[SS] Ranked Play Count",
-            _ranked_play_val(snap_a.scoresaber_ranked_play_count, _ss_ranked_total_a),
-            _ranked_play_val(snap_b.scoresaber_ranked_play_count, _ss_ranked_total_b),
-        )
-        row_main += 1
-        # ScoreSaber グループ: 先頭行に SS アイコンをスパン
-        _grp_ss = QTableWidgetItem("")
-        _grp_ss.setBackground(label_cell_color())
-        _grp_ss.setIcon(self._icon_scoresaber)
-        _grp_ss.setToolTip("ScoreSaber")
-        self.table.setItem(_ss_grp_start, 0, _grp_ss)
-        self.table.setSpan(_ss_grp_start, 0, row_main - _ss_grp_start, 1)
-
-        # BeatLeader
-        _bl_grp_start = row_main
-
         def _format_bl_prestige_value(prestige: "Optional[int]", level: "Optional[int]") -> "tuple[int, str, Optional[int], str] | None":
             if prestige is None:
                 return None
@@ -2015,80 +2362,39 @@ class SnapshotCompareDialog(QDialog):
                 text += f" (Lv.{level:,})"
             return (prestige, text, level, "LV")
 
-        self._set_row(
-            self.table,
-            row_main,
-            "[BL] Prestige",
-            _format_bl_prestige_value(snap_a.beatleader_prestige, snap_a.beatleader_level),
-            _format_bl_prestige_value(snap_b.beatleader_prestige, snap_b.beatleader_level),
-        )
-        row_main += 1
-
-        self._set_row(self.table, row_main, "[BL] PP", snap_a.beatleader_pp, snap_b.beatleader_pp)
-        row_main += 1
-
-        row_main = _set_combined_rank_row(
-            row_main,
-            "[BL] Rank",
-            snap_a.beatleader_rank_global,
-            snap_a.beatleader_country,
-            snap_a.beatleader_rank_country,
-            snap_b.beatleader_rank_global,
-            snap_b.beatleader_country,
-            snap_b.beatleader_rank_country,
-        )
-
-        self._set_row(
-            self.table,
-            row_main,
-            "[BL] Avg Ranked Acc",
-            (round(snap_a.beatleader_average_ranked_acc, 2), f"{snap_a.beatleader_average_ranked_acc:.2f}%") if snap_a.beatleader_average_ranked_acc is not None else None,
-            (round(snap_b.beatleader_average_ranked_acc, 2), f"{snap_b.beatleader_average_ranked_acc:.2f}%") if snap_b.beatleader_average_ranked_acc is not None else None,
-        )
-        row_main += 1
-
-        self._set_row(
-            self.table,
-            row_main,
-            "[BL] Total Play Count",
-            snap_a.beatleader_total_play_count,
-            snap_b.beatleader_total_play_count,
-        )
-        row_main += 1
-
-        self._set_row(
-            self.table,
-            row_main,
-            "[BL] Ranked Play Count",
-            _ranked_play_val(snap_a.beatleader_ranked_play_count, _bl_ranked_total_a),
-            _ranked_play_val(snap_b.beatleader_ranked_play_count, _bl_ranked_total_b),
-        )
-        row_main += 1
-        # BeatLeader グループ: 先頭行に BL アイコンをスパン
-        _grp_bl = QTableWidgetItem("")
-        _grp_bl.setBackground(label_cell_color())
-        _grp_bl.setIcon(self._icon_beatleader)
-        _grp_bl.setToolTip("BeatLeader")
-        self.table.setItem(_bl_grp_start, 0, _grp_bl)
-        self.table.setSpan(_bl_grp_start, 0, row_main - _bl_grp_start, 1)
-
-        def _rl_totals_from_snapshot(snap: Snapshot) -> dict[str, Optional[int]]:
-            overall = snap.accsaber_reloaded_overall_total_maps
-            true_total = snap.accsaber_reloaded_true_total_maps
-            standard_total = snap.accsaber_reloaded_standard_total_maps
-            tech_total = snap.accsaber_reloaded_tech_total_maps
-            if overall is None:
-                parts = [c for c in (true_total, standard_total, tech_total) if c is not None]
-                overall = sum(parts) if parts else None
-            return {
-                "overall": overall,
-                "true": true_total,
-                "standard": standard_total,
-                "tech": tech_total,
-            }
-
-        _rl_totals_a = _rl_totals_from_snapshot(snap_a)
-        _rl_totals_b = _rl_totals_from_snapshot(snap_b)
+        def _fill_metric_group(row: int, specs, icon: QIcon, tooltip: str) -> int:
+            """_SS_METRIC_ROWS / _BL_METRIC_ROWS の定義どおりに行を並べ、先頭行にサービスアイコンをスパンする。"""
+            start = row
+            for label, kind, getter in specs:
+                value_a = getter(snap_a)
+                value_b = getter(snap_b)
+                if kind == "rank":
+                    row = _set_combined_rank_row(row, label, *value_a, *value_b)
+                    continue
+                if kind == "acc":
+                    value_a = _round2_value(value_a, "%")
+                    value_b = _round2_value(value_b, "%")
+                elif kind == "ranked_plays":
+                    value_a = _ranked_play_val(*value_a)
+                    value_b = _ranked_play_val(*value_b)
+                elif kind == "prestige":
+                    value_a = _format_bl_prestige_value(*value_a)
+                    value_b = _format_bl_prestige_value(*value_b)
+                self._set_row(self.table, row, label, value_a, value_b)
+                row += 1
+            grp_item = _reuse_item(self.table, start, 0, "")
+            grp_item.setBackground(_theme_brush(label_cell_color))
+            grp_item.setIcon(icon)
+            grp_item.setToolTip(tooltip)
+            if self.table.rowSpan(start, 0) != row - start:
+                self.table.setSpan(start, 0, row - start, 1)
+            return row
+
+        row_main = _fill_metric_group(row_main, _SS_METRIC_ROWS, self._icon_scoresaber, "ScoreSaber")
+        row_main = _fill_metric_group(row_main, _BL_METRIC_ROWS, self._icon_beatleader, "BeatLeader")
+
+        _rl_totals_a = snap_a.accsaber_reloaded_total_maps_by_category
+        _rl_totals_b = snap_b.accsaber_reloaded_total_maps_by_category
 
         def _play_fmt(plays: int | None, total: Optional[int]):
             """プレイ数を (数値, 'xxx/yyy') タプルに変換する。total が不明なら数値のみ。"""
@@ -2140,15 +2446,53 @@ class SnapshotCompareDialog(QDialog):
             """col 0 にグループラベルをセットし、count 行スパンする。"""
             _icon = self._icon_accsaber
             _gi = QTableWidgetItem(group_text)
-            _gi.setBackground(label_cell_color())
-            _gi.setForeground(label_cell_text_color())
-            _gi.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+            _gi.setBackground(_theme_brush(label_cell_color))
+            _gi.setForeground(_theme_brush(label_cell_text_color))
+            _gi.setTextAlignment(_ALIGN_LEFT_VCENTER)
             _gi.setIcon(_icon)
             self.table_acc.setItem(start_row, 0, _gi)
             if count > 1:
                 self.table_acc.setSpan(start_row, 0, count, 1)
 
         # AccSaber 行: self.table_acc に出力 (row_acc = 0 から)
+        # カテゴリ別グループ (AP / Rank / Play Count / Avg Acc / Skill Level) の行定義
+        _as_ap_rows = (
+            ("[AS] Overall",  "accsaber_reloaded_overall_ap"),
+            ("[AS] True",     "accsaber_reloaded_true_ap"),
+            ("[AS] Standard", "accsaber_reloaded_standard_ap"),
+            ("[AS] Tech",     "accsaber_reloaded_tech_ap"),
+        )
+        _as_rank_rows = (
+            ("[AS] Overall",  "accsaber_reloaded_overall_rank",  "accsaber_reloaded_overall_rank_country"),
+            ("[AS] True",     "accsaber_reloaded_true_rank",     "accsaber_reloaded_true_rank_country"),
+            ("[AS] Standard", "accsaber_reloaded_standard_rank", "accsaber_reloaded_standard_rank_country"),
+            ("[AS] Tech",     "accsaber_reloaded_tech_rank",     "accsaber_reloaded_tech_rank_country"),
+        )
+        _as_play_rows = (
+            ("[AS] Overall",  "accsaber_reloaded_overall_ranked_plays",  "overall"),
+            ("[AS] True",     "accsaber_reloaded_true_ranked_plays",     "true"),
+            ("[AS] Standard", "accsaber_reloaded_standard_ranked_plays", "standard"),
+            ("[AS] Tech",     "accsaber_reloaded_tech_ranked_plays",     "tech"),
+        )
+        _as_acc_rows = (
+            ("[AS] Overall",  "accsaber_reloaded_overall_avg_acc",  "overall"),
+            ("[AS] True",     "accsaber_reloaded_true_avg_acc",     "true"),
+            ("[AS] Standard", "accsaber_reloaded_standard_avg_acc", "standard"),
+            ("[AS] Tech",     "accsaber_reloaded_tech_avg_acc",     "tech"),
+        )
+        _as_skill_rows = (
+            ("[AS] Overall",  "accsaber_reloaded_overall_skill_level",  "overall"),
+            ("[AS] True",     "accsaber_reloaded_true_skill_level",     "true"),
+            ("[AS] Standard", "accsaber_reloaded_standard_skill_level", "standard"),
+            ("[AS] Tech",     "accsaber_reloaded_tech_skill_level",     "tech"),
+        )
+        # XP/MileStone グループ (XP / Rank / Milestones) の行数
+        _as_xp_group_rows = 3
+        # 行数は行定義から決まるので、1 行ずつ増やさずに先に確保しておく
+        self.table_acc.setRowCount(
+            _as_xp_group_rows
+            + sum(len(rows) for rows in (_as_ap_rows, _as_rank_rows, _as_play_rows, _as_acc_rows, _as_skill_rows))
+        )
         row_acc = 0
         _xp_lv_a = snap_a.accsaber_reloaded_xp_level
         _xp_lv_b = snap_b.accsaber_reloaded_xp_level
@@ -2174,7 +2518,7 @@ class SnapshotCompareDialog(QDialog):
                     _diff_item.setText(_diff_item.text() + f" (Lv{_lv_diff:+d})")
             return r + 1
 
-        # 全項目表示 (XP×2 + AP×4 + Rank×4 + Play Count×4 + AvgAcc×4 = 18行)
+        # 全項目表示
         _grp_start = row_acc
         row_acc = _rl_set_xp_row(row_acc)
         row_acc = _set_combined_rank_row(
@@ -2197,42 +2541,25 @@ class SnapshotCompareDialog(QDialog):
             _ms_val(snap_b.accsaber_reloaded_milestones_completed, snap_b.accsaber_reloaded_milestones_total),
         )
         row_acc += 1
-        _set_group_label(_grp_start, 3, "XP/MileStone")
+        _set_group_label(_grp_start, row_acc - _grp_start, "XP/MileStone")
         _grp_start = row_acc
-        for _lbl, _attr in (
-            ("[AS] Overall",  "accsaber_reloaded_overall_ap"),
-            ("[AS] True",     "accsaber_reloaded_true_ap"),
-            ("[AS] Standard", "accsaber_reloaded_standard_ap"),
-            ("[AS] Tech",     "accsaber_reloaded_tech_ap"),
-        ):
-            _v_a = getattr(snap_a, _attr)
-            _v_b = getattr(snap_b, _attr)
+        for _lbl, _attr in _as_ap_rows:
             self._set_row(self.table_acc, row_acc, _lbl,
-                          round(_v_a, 2) if _v_a is not None else None,
-                          round(_v_b, 2) if _v_b is not None else None)
+                          _round2_value(getattr(snap_a, _attr)),
+                          _round2_value(getattr(snap_b, _attr)))
             row_acc += 1
-        _set_group_label(_grp_start, 4, "AP")
+        _set_group_label(_grp_start, row_acc - _grp_start, "AP")
         _grp_start = row_acc
-        for _lbl, _r_attr, _rc_attr in (
-            ("[AS] Overall",  "accsaber_reloaded_overall_rank",  "accsaber_reloaded_overall_rank_country"),
-            ("[AS] True",     "accsaber_reloaded_true_rank",     "accsaber_reloaded_true_rank_country"),
-            ("[AS] Standard", "accsaber_reloaded_standard_rank", "accsaber_reloaded_standard_rank_country"),
-            ("[AS] Tech",     "accsaber_reloaded_tech_rank",     "accsaber_reloaded_tech_rank_country"),
-        ):
+        for _lbl, _r_attr, _rc_attr in _as_rank_rows:
             row_acc = _set_combined_rank_row(
                 row_acc, _lbl,
                 getattr(snap_a, _r_attr), snap_a.scoresaber_country, getattr(snap_a, _rc_attr),
                 getattr(snap_b, _r_attr), snap_b.scoresaber_country, getattr(snap_b, _rc_attr),
                 _tbl=self.table_acc,
             )
-        _set_group_label(_grp_start, 4, "Rank")
+        _set_group_label(_grp_start, row_acc - _grp_start, "Rank")
         _grp_start = row_acc
-        for _lbl, _attr, _cat in (
-            ("[AS] Overall",  "accsaber_reloaded_overall_ranked_plays",  "overall"),
-            ("[AS] True",     "accsaber_reloaded_true_ranked_plays",     "true"),
-            ("[AS] Standard", "accsaber_reloaded_standard_ranked_plays", "standard"),
-            ("[AS] Tech",     "accsaber_reloaded_tech_ranked_plays",     "tech"),
-        ):
+        for _lbl, _attr, _cat in _as_play_rows:
             _pc_a = getattr(snap_a, _attr)
             _pc_b = getattr(snap_b, _attr)
             _rl_total_a = _rl_totals_a.get(_cat)
@@ -2240,37 +2567,25 @@ class SnapshotCompareDialog(QDialog):
             self._set_row(self.table_acc, row_acc, _lbl, _play_fmt(_pc_a, _rl_total_a), _play_fmt(_pc_b, _rl_total_b))
             _set_play_bar(row_acc, _pc_a, _pc_b, _rl_total_a, _rl_total_b, _cat)
             row_acc += 1
-        _set_group_label(_grp_start, 4, "Play Count")
+        _set_group_label(_grp_start, row_acc - _grp_start, "Play Count")
         _grp_start = row_acc
-        for _lbl, _attr, _cat in (
-            ("[AS] Overall",  "accsaber_reloaded_overall_avg_acc",  "overall"),
-            ("[AS] True",     "accsaber_reloaded_true_avg_acc",     "true"),
-            ("[AS] Standard", "accsaber_reloaded_standard_avg_acc", "standard"),
-            ("[AS] Tech",     "accsaber_reloaded_tech_avg_acc",     "tech"),
-        ):
+        for _lbl, _attr, _cat in _as_acc_rows:
             _v_a = getattr(snap_a, _attr)
             _v_b = getattr(snap_b, _attr)
-            self._set_row(self.table_acc, row_acc, _lbl,
-                          (round(_v_a, 2), f"{_v_a:.2f}%") if _v_a is not None else None,
-                          (round(_v_b, 2), f"{_v_b:.2f}%") if _v_b is not None else None)
+            self._set_row(self.table_acc, row_acc, _lbl, _round2_value(_v_a, "%"), _round2_value(_v_b, "%"))
             _set_avg_acc_bar(row_acc, _v_a, _v_b, _cat)
             row_acc += 1
-        _set_group_label(_grp_start, 4, "Avg Acc")
+        _set_group_label(_grp_start, row_acc - _grp_start, "Avg Acc")
         _grp_start = row_acc
-        for _lbl, _attr, _cat in (
-            ("[AS] Overall",  "accsaber_reloaded_overall_skill_level",  "overall"),
-            ("[AS] True",     "accsaber_reloaded_true_skill_level",     "true"),
-            ("[AS] Standard", "accsaber_reloaded_standard_skill_level", "standard"),
-            ("[AS] Tech",     "accsaber_reloaded_tech_skill_level",     "tech"),
-        ):
+        for _lbl, _attr, _cat in _as_skill_rows:
             _v_a = getattr(snap_a, _attr)
             _v_b = getattr(snap_b, _attr)
-            self._set_row(self.table_acc, row_acc, _lbl,
-                          (round(_v_a, 2), f"{_v_a:.2f}") if _v_a is not None else None,
-                          (round(_v_b, 2), f"{_v_b:.2f}") if _v_b is not None else None)
+            self._set_row(self.table_acc, row_acc, _lbl, _round2_value(_v_a, ""), _round2_value(_v_b, ""))
             _set_skill_bar(row_acc, _v_a, _v_b, _cat)
             row_acc += 1
-        _set_group_label(_grp_start, 4, "Skill Level")
+        _set_group_label(_grp_start, row_acc - _grp_start, "Skill Level")
+        # 行定義と実際に埋めた行数がずれていても、空行を残したり行が欠けたりしないよう合わせておく
+        self.table_acc.setRowCount(row_acc)
 
         # AccSaber 比較グリッドのヘッダを更新
         self.acc_cmp_table.setHorizontalHeaderLabels([
@@ -2281,8 +2596,9 @@ class SnapshotCompareDialog(QDialog):
             "A Skill", "B Skill", "\u0394Skill",
         ])
 
-        _label_bg = QColor(label_cell_color())
-        _label_fg = QColor(label_cell_text_color())
+        # ラベル列の色は他のテーブルと同じくブラシキャッシュから引く
+        _label_bg = _theme_brush(label_cell_color)
+        _label_fg = _theme_brush(label_cell_text_color)
 
         def _fill_acc_cmp_table(icon: QIcon, rows_a: list, rows_b: list) -> None:
             """AccSaber比較グリッドに A/B データを設定する。
@@ -2306,28 +2622,23 @@ class SnapshotCompareDialog(QDialog):
                 item_cat = QTableWidgetItem(cat_name)
                 item_cat.setBackground(_label_bg)
                 item_cat.setForeground(_label_fg)
-                item_cat.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+                item_cat.setTextAlignment(_ALIGN_LEFT_VCENTER)
                 self.acc_cmp_table.setItem(row, 0, item_cat)
 
                 # col 1/2/3: A AP / B AP / ΔAP
                 def _ap_item(ap):
-                    it = QTableWidgetItem(f"{round(ap, 2):,.2f}" if ap is not None else "")
-                    it.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                    it = QTableWidgetItem(f"{ap:,.2f}" if ap is not None else "")
+                    it.setTextAlignment(_ALIGN_RIGHT_VCENTER)
                     return it
                 self.acc_cmp_table.setItem(row, 1, _ap_item(ap_a))
                 self.acc_cmp_table.setItem(row, 2, _ap_item(ap_b))
                 delta_ap_item = QTableWidgetItem("")
-                delta_ap_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                delta_ap_item.setTextAlignment(_ALIGN_RIGHT_VCENTER)
                 if ap_a is not None and ap_b is not None:
                     d = ap_b - ap_a
                     delta_ap_item.setText(f"{d:+.2f}")
-                    if d > 0:
-                        delta_ap_item.setBackground(diff_positive_bg())
-                    elif d < 0:
-                        delta_ap_item.setBackground(diff_negative_bg())
-                    else:
-                        delta_ap_item.setBackground(diff_neutral_bg())
-                    delta_ap_item.setForeground(diff_text_color())
+                    delta_ap_item.setBackground(_diff_bg_brush(d))
+                    delta_ap_item.setForeground(_theme_brush(diff_text_color))
                 self.acc_cmp_table.setItem(row, 3, delta_ap_item)
 
                 # col 4/5/6: A Rank / B Rank / ΔRank
@@ -2345,13 +2656,13 @@ class SnapshotCompareDialog(QDialog):
                             t += f" ({rank_c:,})"
                     return t
                 item_ra = QTableWidgetItem(_rank_text(rank_g_a, rank_c_a, country_a))
-                item_ra.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                item_ra.setTextAlignment(_ALIGN_RIGHT_VCENTER)
                 self.acc_cmp_table.setItem(row, 4, item_ra)
                 item_rb = QTableWidgetItem(_rank_text(rank_g_b, rank_c_b, country_b))
-                item_rb.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                item_rb.setTextAlignment(_ALIGN_RIGHT_VCENTER)
                 self.acc_cmp_table.setItem(row, 5, item_rb)
                 delta_rank_item = QTableWidgetItem("")
-                delta_rank_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                delta_rank_item.setTextAlignment(_ALIGN_RIGHT_VCENTER)
                 if rank_g_a is not None and rank_g_b is not None:
                     dr = rank_g_a - rank_g_b  # rank は小さいほど良いので逆向き
                     diff_text = f"{dr:+,}"
@@ -2370,13 +2681,8 @@ class SnapshotCompareDialog(QDialog):
                         else:
                             diff_text += f" ({country_a}{diff_country:+,d})"
                     delta_rank_item.setText(diff_text)
-                    if dr > 0:
-                        delta_rank_item.setBackground(diff_positive_bg())
-                    elif dr < 0:
-                        delta_rank_item.setBackground(diff_negative_bg())
-                    else:
-                        delta_rank_item.setBackground(diff_neutral_bg())
-                    delta_rank_item.setForeground(diff_text_color())
+                    delta_rank_item.setBackground(_diff_bg_brush(dr))
+                    delta_rank_item.setForeground(_theme_brush(diff_text_color))
                 self.acc_cmp_table.setItem(row, 6, delta_rank_item)
 
                 # col 7/8/9: A Play Count / B Play Count / ΔPlay Count（バー付き）
@@ -2385,7 +2691,7 @@ class SnapshotCompareDialog(QDialog):
                         return QTableWidgetItem("")
                     play_text = f"{plays:,}/{plays_total:,}" if plays_total else f"{plays:,}"
                     it = QTableWidgetItem(play_text)
-                    it.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+                    it.setTextAlignment(_ALIGN_LEFT_VCENTER)
                     if plays_total and plays_total > 0:
                         color = ACC_PLAY_COLORS.get(cat_key, QColor(128, 128, 128, 160))
                         it.setData(Qt.ItemDataRole.UserRole, min(1.0, plays / plays_total))
@@ -2394,41 +2700,31 @@ class SnapshotCompareDialog(QDialog):
                 self.acc_cmp_table.setItem(row, 7, _play_item(plays_a, plays_total_a, cat_key_a))
                 self.acc_cmp_table.setItem(row, 8, _play_item(plays_b, plays_total_b, cat_key_a))
                 delta_play_item = QTableWidgetItem("")
-                delta_play_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                delta_play_item.setTextAlignment(_ALIGN_RIGHT_VCENTER)
                 if plays_a is not None and plays_b is not None:
                     dp = plays_b - plays_a
                     delta_play_item.setText(f"{dp:+,}")
-                    if dp > 0:
-                        delta_play_item.setBackground(diff_positive_bg())
-                    elif dp < 0:
-                        delta_play_item.setBackground(diff_negative_bg())
-                    else:
-                        delta_play_item.setBackground(diff_neutral_bg())
-                    delta_play_item.setForeground(diff_text_color())
+                    delta_play_item.setBackground(_diff_bg_brush(dp))
+                    delta_play_item.setForeground(_theme_brush(diff_text_color))
                 self.acc_cmp_table.setItem(row, 9, delta_play_item)
 
                 # col 10/11/12: A Avg Acc / B Avg Acc / ΔAvg Acc（パーセンテージバー）
                 def _acc_item(avg_acc):
                     if avg_acc is not None:
                         it = QTableWidgetItem(f"{avg_acc:.2f}%")
-                        it.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+                        it.setTextAlignment(_ALIGN_LEFT_VCENTER)
                         it.setData(Qt.ItemDataRole.UserRole, avg_acc)
                         return it
                     return QTableWidgetItem("")
                 self.acc_cmp_table.setItem(row, 10, _acc_item(avg_acc_a))
                 self.acc_cmp_table.setItem(row, 11, _acc_item(avg_acc_b))
                 delta_acc_item = QTableWidgetItem("")
-                delta_acc_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                delta_acc_item.setTextAlignment(_ALIGN_RIGHT_VCENTER)
                 if avg_acc_a is not None and avg_acc_b is not None:
                     da = avg_acc_b - avg_acc_a
                     delta_acc_item.setText(f"{da:+.2f}%")
-                    if da > 0:
-                        delta_acc_item.setBackground(diff_positive_bg())
-                    elif da < 0:
-                        delta_acc_item.setBackground(diff_negative_bg())
-                    else:
-                        delta_acc_item.setBackground(diff_neutral_bg())
-                    delta_acc_item.setForeground(diff_text_color())
+                    delta_acc_item.setBackground(_diff_bg_brush(da))
+                    delta_acc_item.setForeground(_theme_brush(diff_text_color))
                 self.acc_cmp_table.setItem(row, 12, delta_acc_item)
 
                 # col 13/14/15: A Skill / B Skill / ΔSkill（Play Count と同じカテゴリ色バー、MAX 100）
@@ -2437,24 +2733,19 @@ class SnapshotCompareDialog(QDialog):
                     if skill is None:
                         return QTableWidgetItem("")
                     it = QTableWidgetItem(f"{skill:.2f}")
-                    it.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+                    it.setTextAlignment(_ALIGN_LEFT_VCENTER)
                     it.setData(Qt.ItemDataRole.UserRole, max(0.0, min(1.0, skill / 100.0)))
                     it.setData(Qt.ItemDataRole.UserRole + 1, _skill_color)
                     return it
                 self.acc_cmp_table.setItem(row, 13, _skill_item(skill_a))
                 self.acc_cmp_table.setItem(row, 14, _skill_item(skill_b))
                 delta_skill_item = QTableWidgetItem("")
-                delta_skill_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                delta_skill_item.setTextAlignment(_ALIGN_RIGHT_VCENTER)
                 if skill_a is not None and skill_b is not None:
                     ds = skill_b - skill_a
                     delta_skill_item.setText(f"{ds:+.2f}")
-                    if ds > 0:
-                        delta_skill_item.setBackground(diff_positive_bg())
-                    elif ds < 0:
-                        delta_skill_item.setBackground(diff_negative_bg())
-                    else:
-                        delta_skill_item.setBackground(diff_neutral_bg())
-                    delta_skill_item.setForeground(diff_text_color())
+                    delta_skill_item.setBackground(_diff_bg_brush(ds))
+                    delta_skill_item.setForeground(_theme_brush(diff_text_color))
                 self.acc_cmp_table.setItem(row, 15, delta_skill_item)
 
         # AccSaber: グリッドテーブルにデータを設定
@@ -2479,6 +2770,14 @@ class SnapshotCompareDialog(QDialog):
         bl_stats_a = snap_a.beatleader_star_stats or []
         bl_stats_b = snap_b.beatleader_star_stats or []
 
+        def _index_by_star(stats) -> dict:
+            """★帯 → 統計エントリの dict を作る（同じ★が重複していれば先頭のものを使う）。"""
+
+            by_star: dict = {}
+            for s in stats:
+                by_star.setdefault(s.star, s)
+            return by_star
+
         def _clear_total_value_and_text(stats):
             """総クリア数を数値＋表示文字列のタプルで返す。"""
 
@@ -2487,96 +2786,85 @@ class SnapshotCompareDialog(QDialog):
             total_maps = sum(s.map_count for s in stats)
             total_clears = sum(s.clear_count for s in stats)
             if total_maps <= 0:
-                text = f"{total_clears} (0.0%)"
+                text = _ZERO_RATE_TEXT if total_clears == 0 else f"{total_clears} (0.0%)"
             else:
                 rate = total_clears / total_maps * 100.0
                 text = f"{total_clears} ({rate:.1f}%)"
             return total_clears, text
 
-        ss_clear_total_a = _clear_total_value_and_text(ss_stats_a)
-        ss_clear_total_b = _clear_total_value_and_text(ss_stats_b)
-        bl_clear_total_a = _clear_total_value_and_text(bl_stats_a)
-        bl_clear_total_b = _clear_total_value_and_text(bl_stats_b)
-
-        def _clear_star_value_and_text(stats, star: int):
+        def _clear_star_value_and_text(by_star, star: int):
             """指定★帯のクリア数を数値＋表示文字列のタプルで返す。"""
 
-            for s in stats:
-                if getattr(s, "star", None) == star:
-                    maps = s.map_count
-                    clears = s.clear_count
-                    if maps <= 0:
-                        text = f"{clears:,} (0.0%)"
-                    else:
-                        rate = clears / maps * 100.0
-                        text = f"{clears:,} ({rate:.1f}%)"
-                    return clears, text
-            return None
+            s = by_star.get(star)
+            if s is None:
+                return None
+            maps = s.map_count
+            clears = s.clear_count
+            if maps <= 0:
+                text = _ZERO_RATE_TEXT if clears == 0 else f"{clears:,} (0.0%)"
+            else:
+                rate = clears / maps * 100.0
+                text = f"{clears:,} ({rate:.1f}%)"
+            return clears, text
 
-        def _avg_acc_star_value_and_text(stats, star: int):
+        def _avg_acc_star_value_and_text(by_star, star: int):
             """指定★帯の平均精度(%)を数値＋表示文字列のタプルで返す。
 
-            stats が空でなければ（=このスナップはデータ取得済み）、
+            by_star が空でなければ（=このスナップはデータ取得済み）、
             ★エントリが存在しない or average_acc が None の場合は (0, "0.00") を返す。
-            stats が空の場合のみ None（データ未取得）を返す。
+            by_star が空の場合のみ None（データ未取得）を返す。
             """
 
-            for s in stats:
-                if getattr(s, "star", None) == star:
-                    avg = getattr(s, "average_acc", None)
-                    return (avg, f"{avg:.2f}") if avg is not None else (0, "0.00")
-            return (0, "0.00") if stats else None
+            s = by_star.get(star)
+            if s is None:
+                return _ZERO_ACC_PAIR if by_star else None
+            avg = s.average_acc
+            return (avg, f"{avg:.2f}") if avg is not None else _ZERO_ACC_PAIR
 
-        def _avg_acc_left_star_value_and_text(stats, star: int):
+        def _avg_acc_left_star_value_and_text(by_star, star: int):
             """指定★帯の左手平均精度(%)を数値＋表示文字列のタプルで返す（BL専用）。"""
 
-            for s in stats:
-                if getattr(s, "star", None) == star:
-                    val = getattr(s, "avg_acc_left", None)
-                    if val is None:
-                        return None
-                    return val, f"{val:.2f}"
-            return None
+            s = by_star.get(star)
+            val = s.avg_acc_left if s is not None else None
+            if val is None:
+                return None
+            return val, f"{val:.2f}"
 
-        def _avg_acc_right_star_value_and_text(stats, star: int):
+        def _avg_acc_right_star_value_and_text(by_star, star: int):
             """指定★帯の右手平均精度(%)を数値＋表示文字列のタプルで返す（BL専用）。"""
 
-            for s in stats:
-                if getattr(s, "star", None) == star:
-                    val = getattr(s, "avg_acc_right", None)
-                    if val is None:
-                        return None
-                    return val, f"{val:.2f}"
-            return None
+            s = by_star.get(star)
+            val = s.avg_acc_right if s is not None else None
+            if val is None:
+                return None
+            return val, f"{val:.2f}"
 
-        def _fc_star_value_and_text(stats, star: int):
+        def _fc_star_value_and_text(by_star, star: int):
             """指定★帯のFC数を数値＋表示文字列のタプルで返す。"""
 
-            for s in stats:
-                if getattr(s, "star", None) == star:
-                    fc = getattr(s, "fc_count", None)
-                    if fc is None:
-                        return None  # 未集計
-                    maps = s.map_count
-                    if maps <= 0:
-                        text = f"{fc:,} (0.0%)"
-                    else:
-                        rate = fc / maps * 100.0
-                        text = f"{fc:,} ({rate:.1f}%)"
-                    return fc, text
-            return None
+            s = by_star.get(star)
+            fc = s.fc_count if s is not None else None
+            if fc is None:
+                return None  # ★エントリなし or 未集計
+            maps = s.map_count
+            if maps <= 0:
+                text = _ZERO_RATE_TEXT if fc == 0 else f"{fc:,} (0.0%)"
+            else:
+                rate = fc / maps * 100.0
+                text = f"{fc:,} ({rate:.1f}%)"
+            return fc, text
 
         def _fc_total_value_and_text(stats):
             """全★帯合計FCを数値＋表示文字列のタプルで返す。"""
 
             if not stats:
                 return None
-            if all(getattr(s, "fc_count", None) is None for s in stats):
+            if all(s.fc_count is None for s in stats):
                 return None  # 未集計
             total_maps = sum(s.map_count for s in stats)
-            total_fc = sum(getattr(s, "fc_count", None) or 0 for s in stats)
+            total_fc = sum(s.fc_count or 0 for s in stats)
             if total_maps <= 0:
-                text = f"{total_fc:,} (0.0%)"
+                text = _ZERO_RATE_TEXT if total_fc == 0 else f"{total_fc:,} (0.0%)"
             else:
                 rate = total_fc / total_maps * 100.0
                 text = f"{total_fc:,} ({rate:.1f}%)"
@@ -2589,57 +2877,56 @@ class SnapshotCompareDialog(QDialog):
                 return None
             return avg_acc, f"{avg_acc:.2f}"
 
-        def _pp_star_value_and_text(stats, star: int):
+        def _is_new_fmt(stats) -> bool:
+            """fc_count が設定済みのエントリがある（新フォーマット = PP 集計済み）か。"""
+
+            return any(s.fc_count is not None for s in stats)
+
+        def _pp_star_value_and_text(by_star, star: int, new_fmt: bool):
             """指定★帯の pp_contribution を数値＋表示文字列のタプルで返す。
 
-            fc_count が設定済みのエントリがある（新フォーマット = PP 集計済み）場合に限り、
+            新フォーマット（new_fmt）の場合に限り、
             ★エントリなし or pp_contribution が None → (0, "0") を返す。
             旧フォーマット（fc_count がすべて None）なら None を返す。
             """
 
-            new_fmt = any(getattr(s, "fc_count", None) is not None for s in stats)
-            for s in stats:
-                if getattr(s, "star", None) == star:
-                    pp = getattr(s, "pp_contribution", None)
-                    if pp is None:
-                        return (0, "0") if new_fmt else None
-                    return pp, f"{pp:,.0f}"
-            return (0, "0") if new_fmt else None
+            s = by_star.get(star)
+            pp = s.pp_contribution if s is not None else None
+            if pp is None:
+                return _ZERO_PP_PAIR if new_fmt else None
+            return pp, f"{pp:,.0f}"
 
         def _pp_total_value_and_text(stats):
             """全★帯合計 pp_contribution を数値＋表示文字列のタプルで返す。"""
 
             if not stats:
                 return None
-            vals = [getattr(s, "pp_contribution", None) for s in stats]
+            vals = [s.pp_contribution for s in stats]
             if all(v is None for v in vals):
                 return None
             total_pp = sum(v for v in vals if v is not None)
             return total_pp, f"{total_pp:,.0f}"
 
-        def _pp_solo_star_value_and_text(stats, star: int):
+        def _pp_solo_star_value_and_text(by_star, star: int, new_fmt: bool):
             """指定★帯の pp_solo を数値＋表示文字列のタプルで返す。
 
-            fc_count が設定済みのエントリがある（新フォーマット = PP 集計済み）場合に限り、
+            新フォーマット（new_fmt）の場合に限り、
             ★エントリなし or pp_solo が None → (0, "0") を返す。
             旧フォーマット（fc_count がすべて None）なら None を返す。
             """
 
-            new_fmt = any(getattr(s, "fc_count", None) is not None for s in stats)
-            for s in stats:
-                if getattr(s, "star", None) == star:
-                    pp = getattr(s, "pp_solo", None)
-                    if pp is None:
-                        return (0, "0") if new_fmt else None
-                    return pp, f"{pp:,.0f}"
-            return (0, "0") if new_fmt else None
+            s = by_star.get(star)
+            pp = s.pp_solo if s is not None else None
+            if pp is None:
+                return _ZERO_PP_PAIR if new_fmt else None
+            return pp, f"{pp:,.0f}"
 
         def _pp_solo_total_value_and_text(stats):
             """全★帯合計 pp_solo を数値＋表示文字列のタプルで返す。"""
 
             if not stats:
                 return None
-            vals = [getattr(s, "pp_solo", None) for s in stats]
+            vals = [s.pp_solo for s in stats]
             if all(v is None for v in vals):
                 return None
             total_pp = sum(v for v in vals if v is not None)
@@ -2653,6 +2940,22 @@ class SnapshotCompareDialog(QDialog):
             numeric, text = value_and_text
             return numeric, "" if text is None else str(text)
 
+        def _percent_item(text: str) -> QTableWidgetItem:
+            """PercentageBarDelegate を割り当てた列のセルを作る。
+
+            バー描画用の % 値はここで 1 回だけ解析して UserRole に入れておく。
+            """
+            item = QTableWidgetItem(text)
+            value = _parse_percent_text(text)
+            if value is not None:
+                item.setData(Qt.ItemDataRole.UserRole, value)
+            return item
+
+        # ★別テーブルの各セルで使うブラシ（行ごとに引き直さない）
+        label_bg_brush = _theme_brush(label_cell_color)
+        label_fg_brush = _theme_brush(label_cell_text_color)
+        diff_fg_brush = _theme_brush(diff_text_color)
+
         def _set_star_row(  # type: ignore[name-defined]
             table: QTableWidget,
             row: int,
@@ -2673,26 +2976,28 @@ class SnapshotCompareDialog(QDialog):
             pp_solo_a/b を渡すと列 13-15 に Solo PP 値と差分を設定する。
             """
 
-            while table.rowCount() <= row:
-                table.insertRow(table.rowCount())
+            if table.rowCount() <= row:
+                table.setRowCount(row + 1)
+            # 1 行で十数回呼ぶので、バインド済みメソッドをローカルに持っておく
+            set_item = table.setItem
 
             star_item = QTableWidgetItem(label)
-            star_item.setBackground(label_cell_color())
-            star_item.setForeground(label_cell_text_color())
+            star_item.setBackground(label_bg_brush)
+            star_item.setForeground(label_fg_brush)
             # 右寄せ
-            star_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            table.setItem(row, 0, star_item)
+            star_item.setTextAlignment(_ALIGN_RIGHT)
+            set_item(row, 0, star_item)
 
             a_clear_val, a_clear_text = _normalize_pair(clear_a)
             b_clear_val, b_clear_text = _normalize_pair(clear_b)
 
             # Clear 数
-            table.setItem(row, 1, QTableWidgetItem(a_clear_text))
-            table.setItem(row, 2, QTableWidgetItem(b_clear_text))
+            set_item(row, 1, _percent_item(a_clear_text))
+            set_item(row, 2, _percent_item(b_clear_text))
 
             # Clear 差分
             diff_clear_item = QTableWidgetItem("")
-            diff_clear_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            diff_clear_item.setTextAlignment(_ALIGN_RIGHT_VCENTER)
             if isinstance(a_clear_val, (int, float)) and isinstance(b_clear_val, (int, float)):
                 diff = b_clear_val - a_clear_val
                 if isinstance(a_clear_val, float) or isinstance(b_clear_val, float):
@@ -2700,41 +3005,30 @@ class SnapshotCompareDialog(QDialog):
                 else:
                     diff_clear_item.setText(f"{diff:+d}")
 
-                if diff > 0:
-                    color = diff_positive_bg()
-                elif diff < 0:
-                    color = diff_negative_bg()
-                else:
-                    color = diff_neutral_bg()
-                diff_clear_item.setBackground(color)
-                diff_clear_item.setForeground(diff_text_color())
+                diff_clear_item.setBackground(_diff_bg_brush(diff))
+                diff_clear_item.setForeground(diff_fg_brush)
             elif a_clear_val is not None or b_clear_val is not None:
                 diff_clear_item.setText("-")
 
-            table.setItem(row, 3, diff_clear_item)
+            set_item(row, 3, diff_clear_item)
 
             # FC 列 (新配置: 列4-6)
             if fc_a is not None or fc_b is not None:
                 a_fc_val, a_fc_text = _normalize_pair(fc_a) if fc_a is not None else (None, "")
                 b_fc_val, b_fc_text = _normalize_pair(fc_b) if fc_b is not None else (None, "")
-                table.setItem(row, 4, QTableWidgetItem(a_fc_text))
-                table.setItem(row, 5, QTableWidgetItem(b_fc_text))
+                set_item(row, 4, _percent_item(a_fc_text))
+                set_item(row, 5, _percent_item(b_fc_text))
 
                 diff_fc_item = QTableWidgetItem("")
-                diff_fc_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                diff_fc_item.setTextAlignment(_ALIGN_RIGHT_VCENTER)
                 if isinstance(a_fc_val, (int, float)) and isinstance(b_fc_val, (int, float)):
                     fc_diff = int(b_fc_val) - int(a_fc_val)
                     diff_fc_item.setText(f"{fc_diff:+d}")
-                    if fc_diff > 0:
-                        diff_fc_item.setBackground(diff_positive_bg())
-                    elif fc_diff < 0:
-                        diff_fc_item.setBackground(diff_negative_bg())
-                    else:
-                        diff_fc_item.setBackground(diff_neutral_bg())
-                    diff_fc_item.setForeground(diff_text_color())
+                    diff_fc_item.setBackground(_diff_bg_brush(fc_diff))
+                    diff_fc_item.setForeground(diff_fg_brush)
                 elif a_fc_val is not None or b_fc_val is not None:
                     diff_fc_item.setText("-")
-                table.setItem(row, 6, diff_fc_item)
+                set_item(row, 6, diff_fc_item)
 
             # AvgAcc (新配置: 列7-9)
             # AvgAcc: 両方 None なら FC 同様にセルを設定しない（空白）
@@ -2743,12 +3037,12 @@ class SnapshotCompareDialog(QDialog):
                 b_avg_val, b_avg_text = _normalize_pair(avg_b) if avg_b is not None else (None, "")
                 a_avg_display = (a_avg_text + "%") if isinstance(a_avg_val, (int, float)) else ""
                 b_avg_display = (b_avg_text + "%") if isinstance(b_avg_val, (int, float)) else ""
-                table.setItem(row, 7, QTableWidgetItem(a_avg_display))
-                table.setItem(row, 8, QTableWidgetItem(b_avg_display))
+                set_item(row, 7, _percent_item(a_avg_display))
+                set_item(row, 8, _percent_item(b_avg_display))
 
                 # ΔAcc (L/R 差分を付加する場合は括弧内に表示)
                 diff_acc_item = QTableWidgetItem("")
-                diff_acc_item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+                diff_acc_item.setTextAlignment(_ALIGN_LEFT_VCENTER)
                 if isinstance(a_avg_val, (int, float)) and isinstance(b_avg_val, (int, float)):
                     diff = b_avg_val - a_avg_val
                     diff_text = f"{diff:+.2f}%"
@@ -2767,154 +3061,175 @@ class SnapshotCompareDialog(QDialog):
                         diff_text += f"({ld:+.2f}/{rd:+.2f})"
 
                     diff_acc_item.setText(diff_text)
-                    if diff > 0:
-                        color = diff_positive_bg()
-                    elif diff < 0:
-                        color = diff_negative_bg()
-                    else:
-                        color = diff_neutral_bg()
-                    diff_acc_item.setBackground(color)
-                    diff_acc_item.setForeground(diff_text_color())
+                    diff_acc_item.setBackground(_diff_bg_brush(diff))
+                    diff_acc_item.setForeground(diff_fg_brush)
                 elif a_avg_val is not None or b_avg_val is not None:
                     diff_acc_item.setText("-")
 
-                table.setItem(row, 9, diff_acc_item)
+                set_item(row, 9, diff_acc_item)
 
             # ★列(繰り返し) 刔10 - star_item と同じ内容
-            star_repeat = QTableWidgetItem(label)
-            star_repeat.setBackground(label_cell_color())
-            star_repeat.setForeground(label_cell_text_color())
-            star_repeat.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            table.setItem(row, 10, star_repeat)
+            set_item(row, 10, star_item.clone())
 
             # PP 列 (新配置: 刔11-13) — 両方 None なら FC 同様に空白
             if pp_a is not None or pp_b is not None:
                 a_pp_val, a_pp_text = _normalize_pair(pp_a) if pp_a is not None else (None, "")
                 b_pp_val, b_pp_text = _normalize_pair(pp_b) if pp_b is not None else (None, "")
-                table.setItem(row, 11, QTableWidgetItem(a_pp_text))
-                table.setItem(row, 12, QTableWidgetItem(b_pp_text))
+                set_item(row, 11, QTableWidgetItem(a_pp_text))
+                set_item(row, 12, QTableWidgetItem(b_pp_text))
 
                 diff_pp_item = QTableWidgetItem("")
-                diff_pp_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                diff_pp_item.setTextAlignment(_ALIGN_RIGHT_VCENTER)
                 if isinstance(a_pp_val, (int, float)) and isinstance(b_pp_val, (int, float)):
                     pp_diff = b_pp_val - a_pp_val
                     diff_pp_item.setText(f"{pp_diff:+.0f}")
-                    if pp_diff > 0:
-                        diff_pp_item.setBackground(diff_positive_bg())
-                    elif pp_diff < 0:
-                        diff_pp_item.setBackground(diff_negative_bg())
-                    else:
-                        diff_pp_item.setBackground(diff_neutral_bg())
-                    diff_pp_item.setForeground(diff_text_color())
+                    diff_pp_item.setBackground(_diff_bg_brush(pp_diff))
+                    diff_pp_item.setForeground(diff_fg_brush)
                 elif a_pp_val is not None or b_pp_val is not None:
                     diff_pp_item.setText("-")
-                table.setItem(row, 13, diff_pp_item)
+                set_item(row, 13, diff_pp_item)
 
             # Solo PP 列 (新配置: 刔14-16) — 両方 None なら FC 同様に空白
             if pp_solo_a is not None or pp_solo_b is not None:
                 a_sp_val, a_sp_text = _normalize_pair(pp_solo_a) if pp_solo_a is not None else (None, "")
                 b_sp_val, b_sp_text = _normalize_pair(pp_solo_b) if pp_solo_b is not None else (None, "")
                 _a_sp_item = QTableWidgetItem(a_sp_text)
-                _a_sp_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                table.setItem(row, 14, _a_sp_item)
+                _a_sp_item.setTextAlignment(_ALIGN_RIGHT_VCENTER)
+                set_item(row, 14, _a_sp_item)
                 _b_sp_item = QTableWidgetItem(b_sp_text)
-                _b_sp_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                table.setItem(row, 15, _b_sp_item)
+                _b_sp_item.setTextAlignment(_ALIGN_RIGHT_VCENTER)
+                set_item(row, 15, _b_sp_item)
 
                 diff_sp_item = QTableWidgetItem("")
-                diff_sp_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                diff_sp_item.setTextAlignment(_ALIGN_RIGHT_VCENTER)
                 if isinstance(a_sp_val, (int, float)) and isinstance(b_sp_val, (int, float)):
                     sp_diff = b_sp_val - a_sp_val
                     diff_sp_item.setText(f"{sp_diff:+.0f}")
-                    if sp_diff > 0:
-                        diff_sp_item.setBackground(diff_positive_bg())
-                    elif sp_diff < 0:
-                        diff_sp_item.setBackground(diff_negative_bg())
-                    else:
-                        diff_sp_item.setBackground(diff_neutral_bg())
-                    diff_sp_item.setForeground(diff_text_color())
+                    diff_sp_item.setBackground(_diff_bg_brush(sp_diff))
+                    diff_sp_item.setForeground(diff_fg_brush)
                 elif a_sp_val is not None or b_sp_val is not None:
                     diff_sp_item.setText("-")
-                table.setItem(row, 16, diff_sp_item)
-
-        # ScoreSaber 側テーブル
-        stars_ss = sorted({s.star for s in ss_stats_a} | {s.star for s in ss_stats_b})
-        # ScoreSaber は現在★15が存在しないので、★0〜14 までに限定
-        stars_ss = [star for star in stars_ss if star <= 14]
-
-        row_ss = 0
-        for star in stars_ss:
-            ss_a_clear = _clear_star_value_and_text(ss_stats_a, star)
-            ss_b_clear = _clear_star_value_and_text(ss_stats_b, star)
-            ss_a_avg = _avg_acc_star_value_and_text(ss_stats_a, star)
-            ss_b_avg = _avg_acc_star_value_and_text(ss_stats_b, star)
-            ss_a_fc = _fc_star_value_and_text(ss_stats_a, star)
-            ss_b_fc = _fc_star_value_and_text(ss_stats_b, star)
-            ss_a_pp = _pp_star_value_and_text(ss_stats_a, star)
-            ss_b_pp = _pp_star_value_and_text(ss_stats_b, star)
-            ss_a_sp = _pp_solo_star_value_and_text(ss_stats_a, star)
-            ss_b_sp = _pp_solo_star_value_and_text(ss_stats_b, star)
-            _set_star_row(self.ss_star_table, row_ss, str(star), ss_a_clear, ss_b_clear, ss_a_avg, ss_b_avg, fc_a=ss_a_fc, fc_b=ss_b_fc, pp_a=ss_a_pp, pp_b=ss_b_pp, pp_solo_a=ss_a_sp, pp_solo_b=ss_b_sp)
-            row_ss += 1
-
-        # Total は一番下に表示
-        if ss_clear_total_a is not None or ss_clear_total_b is not None:
-            ss_avg_total_a = _avg_acc_total_value_and_text(snap_a.scoresaber_average_ranked_acc)
-            ss_avg_total_b = _avg_acc_total_value_and_text(snap_b.scoresaber_average_ranked_acc)
-            ss_fc_total_a = _fc_total_value_and_text(ss_stats_a)
-            ss_fc_total_b = _fc_total_value_and_text(ss_stats_b)
-            ss_pp_total_a = _pp_total_value_and_text(ss_stats_a)
-            ss_pp_total_b = _pp_total_value_and_text(ss_stats_b)
-            ss_sp_total_a = _pp_solo_total_value_and_text(ss_stats_a)
-            ss_sp_total_b = _pp_solo_total_value_and_text(ss_stats_b)
-            _set_star_row(self.ss_star_table, row_ss, "Total", ss_clear_total_a, ss_clear_total_b, ss_avg_total_a, ss_avg_total_b, fc_a=ss_fc_total_a, fc_b=ss_fc_total_b, pp_a=ss_pp_total_a, pp_b=ss_pp_total_b, pp_solo_a=ss_sp_total_a, pp_solo_b=ss_sp_total_b)
-
-        # BeatLeader 側テーブル
-        stars_bl = sorted({s.star for s in bl_stats_a} | {s.star for s in bl_stats_b})
-
-        row_bl = 0
-        for star in stars_bl:
-            bl_a_clear = _clear_star_value_and_text(bl_stats_a, star)
-            bl_b_clear = _clear_star_value_and_text(bl_stats_b, star)
-            bl_a_avg = _avg_acc_star_value_and_text(bl_stats_a, star)
-            bl_b_avg = _avg_acc_star_value_and_text(bl_stats_b, star)
-            bl_a_left = _avg_acc_left_star_value_and_text(bl_stats_a, star)
-            bl_b_left = _avg_acc_left_star_value_and_text(bl_stats_b, star)
-            bl_a_right = _avg_acc_right_star_value_and_text(bl_stats_a, star)
-            bl_b_right = _avg_acc_right_star_value_and_text(bl_stats_b, star)
-            bl_a_fc = _fc_star_value_and_text(bl_stats_a, star)
-            bl_b_fc = _fc_star_value_and_text(bl_stats_b, star)
-            bl_a_pp = _pp_star_value_and_text(bl_stats_a, star)
-            bl_b_pp = _pp_star_value_and_text(bl_stats_b, star)
-            bl_a_sp = _pp_solo_star_value_and_text(bl_stats_a, star)
-            bl_b_sp = _pp_solo_star_value_and_text(bl_stats_b, star)
-            _set_star_row(
-                self.bl_star_table, row_bl, str(star),
-                bl_a_clear, bl_b_clear, bl_a_avg, bl_b_avg,
-                avg_left_a=bl_a_left, avg_left_b=bl_b_left,
-                avg_right_a=bl_a_right, avg_right_b=bl_b_right,
-                fc_a=bl_a_fc, fc_b=bl_b_fc,
-                pp_a=bl_a_pp, pp_b=bl_b_pp,
-                pp_solo_a=bl_a_sp, pp_solo_b=bl_b_sp,
-            )
-            row_bl += 1
-
-        if bl_clear_total_a is not None or bl_clear_total_b is not None:
-            bl_avg_total_a = _avg_acc_total_value_and_text(snap_a.beatleader_average_ranked_acc)
-            bl_avg_total_b = _avg_acc_total_value_and_text(snap_b.beatleader_average_ranked_acc)
-            bl_fc_total_a = _fc_total_value_and_text(bl_stats_a)
-            bl_fc_total_b = _fc_total_value_and_text(bl_stats_b)
-            bl_pp_total_a = _pp_total_value_and_text(bl_stats_a)
-            bl_pp_total_b = _pp_total_value_and_text(bl_stats_b)
-            bl_sp_total_a = _pp_solo_total_value_and_text(bl_stats_a)
-            bl_sp_total_b = _pp_solo_total_value_and_text(bl_stats_b)
-            _set_star_row(
-                self.bl_star_table, row_bl, "Total",
-                bl_clear_total_a, bl_clear_total_b, bl_avg_total_a, bl_avg_total_b,
-                fc_a=bl_fc_total_a, fc_b=bl_fc_total_b,
-                pp_a=bl_pp_total_a, pp_b=bl_pp_total_b,
-                pp_solo_a=bl_sp_total_a, pp_solo_b=bl_sp_total_b,
-            )
+                set_item(row, 16, diff_sp_item)
+
+        def _build_star_plan():
+            """★別テーブル 2 つ分の行データ（_set_star_row に渡す引数）だけを先に組み立てる。
+
+            Qt には触れないので、組み立てとテーブルへの反映を分けておける。
+            戻り値は (ScoreSaber 行リスト, BeatLeader 行リスト)。各行は
+            (label, clear_a, clear_b, avg_a, avg_b, left_a, left_b, right_a, right_b,
+            fc_a, fc_b, pp_a, pp_b, solo_a, solo_b) のタプル。
+            """
+
+            # ★ごとの行で毎回 stats を先頭から探さないよう、★帯で引ける dict を 1 回だけ作る
+            ss_a_by_star = _index_by_star(ss_stats_a)
+            ss_b_by_star = _index_by_star(ss_stats_b)
+            bl_a_by_star = _index_by_star(bl_stats_a)
+            bl_b_by_star = _index_by_star(bl_stats_b)
+
+            ss_clear_total_a = _clear_total_value_and_text(ss_stats_a)
+            ss_clear_total_b = _clear_total_value_and_text(ss_stats_b)
+            bl_clear_total_a = _clear_total_value_and_text(bl_stats_a)
+            bl_clear_total_b = _clear_total_value_and_text(bl_stats_b)
+
+            ss_a_new_fmt = _is_new_fmt(ss_stats_a)
+            ss_b_new_fmt = _is_new_fmt(ss_stats_b)
+            bl_a_new_fmt = _is_new_fmt(bl_stats_a)
+            bl_b_new_fmt = _is_new_fmt(bl_stats_b)
+
+            # ScoreSaber は現在★15が存在しないので、★0〜14 までに限定
+            stars_ss = sorted(star for star in ss_a_by_star.keys() | ss_b_by_star.keys() if star <= 14)
+            ss_rows = [
+                (
+                    str(star),
+                    _clear_star_value_and_text(ss_a_by_star, star),
+                    _clear_star_value_and_text(ss_b_by_star, star),
+                    _avg_acc_star_value_and_text(ss_a_by_star, star),
+                    _avg_acc_star_value_and_text(ss_b_by_star, star),
+                    None, None,
+                    None, None,
+                    _fc_star_value_and_text(ss_a_by_star, star),
+                    _fc_star_value_and_text(ss_b_by_star, star),
+                    _pp_star_value_and_text(ss_a_by_star, star, ss_a_new_fmt),
+                    _pp_star_value_and_text(ss_b_by_star, star, ss_b_new_fmt),
+                    _pp_solo_star_value_and_text(ss_a_by_star, star, ss_a_new_fmt),
+                    _pp_solo_star_value_and_text(ss_b_by_star, star, ss_b_new_fmt),
+                )
+                for star in stars_ss
+            ]
+            # Total は一番下に表示
+            if ss_clear_total_a is not None or ss_clear_total_b is not None:
+                ss_rows.append((
+                    "Total",
+                    ss_clear_total_a,
+                    ss_clear_total_b,
+                    _avg_acc_total_value_and_text(snap_a.scoresaber_average_ranked_acc),
+                    _avg_acc_total_value_and_text(snap_b.scoresaber_average_ranked_acc),
+                    None, None,
+                    None, None,
+                    _fc_total_value_and_text(ss_stats_a),
+                    _fc_total_value_and_text(ss_stats_b),
+                    _pp_total_value_and_text(ss_stats_a),
+                    _pp_total_value_and_text(ss_stats_b),
+                    _pp_solo_total_value_and_text(ss_stats_a),
+                    _pp_solo_total_value_and_text(ss_stats_b),
+                ))
+
+            stars_bl = sorted(bl_a_by_star.keys() | bl_b_by_star.keys())
+            bl_rows = [
+                (
+                    str(star),
+                    _clear_star_value_and_text(bl_a_by_star, star),
+                    _clear_star_value_and_text(bl_b_by_star, star),
+                    _avg_acc_star_value_and_text(bl_a_by_star, star),
+                    _avg_acc_star_value_and_text(bl_b_by_star, star),
+                    _avg_acc_left_star_value_and_text(bl_a_by_star, star),
+                    _avg_acc_left_star_value_and_text(bl_b_by_star, star),
+                    _avg_acc_right_star_value_and_text(bl_a_by_star, star),
+                    _avg_acc_right_star_value_and_text(bl_b_by_star, star),
+                    _fc_star_value_and_text(bl_a_by_star, star),
+                    _fc_star_value_and_text(bl_b_by_star, star),
+                    _pp_star_value_and_text(bl_a_by_star, star, bl_a_new_fmt),
+                    _pp_star_value_and_text(bl_b_by_star, star, bl_b_new_fmt),
+                    _pp_solo_star_value_and_text(bl_a_by_star, star, bl_a_new_fmt),
+                    _pp_solo_star_value_and_text(bl_b_by_star, star, bl_b_new_fmt),
+                )
+                for star in stars_bl
+            ]
+            if bl_clear_total_a is not None or bl_clear_total_b is not None:
+                bl_rows.append((
+                    "Total",
+                    bl_clear_total_a,
+                    bl_clear_total_b,
+                    _avg_acc_total_value_and_text(snap_a.beatleader_average_ranked_acc),
+                    _avg_acc_total_value_and_text(snap_b.beatleader_average_ranked_acc),
+                    None, None,
+                    None, None,
+                    _fc_total_value_and_text(bl_stats_a),
+                    _fc_total_value_and_text(bl_stats_b),
+                    _pp_total_value_and_text(bl_stats_a),
+                    _pp_total_value_and_text(bl_stats_b),
+                    _pp_solo_total_value_and_text(bl_stats_a),
+                    _pp_solo_total_value_and_text(bl_stats_b),
+                ))
+            return ss_rows, bl_rows
+
+        # A/B を行き来するだけの切り替えでは同じ組み合わせが何度も来るので、直近数組分の行データを使い回す。
+        # キーは id() だが、値側でスナップショット自体を保持しているので id が別オブジェクトに再利用されることはない
+        plan_key = (id(snap_a), id(snap_b))
+        plan_entry = self._star_plan_cache.pop(plan_key, None)
+        if plan_entry is None:
+            plan_entry = (snap_a, snap_b, _build_star_plan())
+        # 末尾に入れ直して「最近使った順」を保ち、溢れたら一番古い組み合わせを捨てる
+        self._star_plan_cache[plan_key] = plan_entry
+        if len(self._star_plan_cache) > _STAR_PLAN_CACHE_SIZE:
+            del self._star_plan_cache[next(iter(self._star_plan_cache))]
+
+        # 組み立てた行データをテーブルへ反映する（行数は先にまとめて確保する）
+        ss_rows, bl_rows = plan_entry[2]
+        for star_table, star_rows in ((self.ss_star_table, ss_rows), (self.bl_star_table, bl_rows)):
+            star_table.setRowCount(len(star_rows))
+            for row, star_args in enumerate(star_rows):
+                _set_star_row(star_table, row, *star_args)
 
         self.table.resizeColumnToContents(0)  # Metric列のみ自動調整、A/B/Diff列は固定幅
         # チェックボックスで設定された列の表示/非表示を再適用
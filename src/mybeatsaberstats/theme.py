@@ -237,34 +237,48 @@ def action_button_green_stylesheet() -> str:
 # ------------------------------------------------------------------ #
 #  テーマ別カラーヘルパー
 # ------------------------------------------------------------------ #
+# 色の定義は文字列の解析を毎回しないよう一度だけ作っておき、公開関数からはコピーを返す。
+# 呼び出し側が setAlpha などで書き換えても、アプリ全体のテーマ色には影響しない
+_LABEL_CELL_BG_DARK   = QColor("#2d2d2d")
+_LABEL_CELL_BG_LIGHT  = QColor(248, 248, 248)
+_CELL_TEXT_DARK       = QColor("#e0e0e0")
+_CELL_TEXT_LIGHT      = QColor("#111111")
+_DIFF_POSITIVE_DARK   = QColor("#3a7a3a")
+_DIFF_POSITIVE_LIGHT  = QColor(180, 255, 180)
+_DIFF_NEGATIVE_DARK   = QColor("#7a3a3a")
+_DIFF_NEGATIVE_LIGHT  = QColor(255, 200, 200)
+_DIFF_NEUTRAL_DARK    = QColor("#2a2a2a")
+_DIFF_NEUTRAL_LIGHT   = QColor(230, 230, 230)
+
+
 def label_cell_color() -> QColor:
     """Metric / ★ などラベル列のセル背景色。"""
-    return QColor("#2d2d2d") if _dark_mode else QColor(248, 248, 248)
+    return QColor(_LABEL_CELL_BG_DARK if _dark_mode else _LABEL_CELL_BG_LIGHT)
 
 
 def label_cell_text_color() -> QColor:
     """ラベル列のテキスト色。"""
-    return QColor("#e0e0e0") if _dark_mode else QColor("#111111")
+    return QColor(_CELL_TEXT_DARK if _dark_mode else _CELL_TEXT_LIGHT)
 
 
 def diff_positive_bg() -> QColor:
     """diff がプラス（改善）のセル背景色。"""
-    return QColor("#3a7a3a") if _dark_mode else QColor(180, 255, 180)
+    return QColor(_DIFF_POSITIVE_DARK if _dark_mode else _DIFF_POSITIVE_LIGHT)
 
 
 def diff_negative_bg() -> QColor:
     """diff がマイナス（悪化）のセル背景色。"""
-    return QColor("#7a3a3a") if _dark_mode else QColor(255, 200, 200)
+    return QColor(_DIFF_NEGATIVE_DARK if _dark_mode else _DIFF_NEGATIVE_LIGHT)
 
 
 def diff_neutral_bg() -> QColor:
     """diff がゼロ（変化なし）のセル背景色。"""
-    return QColor("#2a2a2a") if _dark_mode else QColor(230, 230, 230)
+    return QColor(_DIFF_NEUTRAL_DARK if _dark_mode else _DIFF_NEUTRAL_LIGHT)
 
 
 def diff_text_color() -> QColor:
     """diff セルのテキスト色。ダーク時は明るめ、ライト時は暗め。"""
-    return QColor("#e0e0e0") if _dark_mode else QColor("#111111")
+    return QColor(_CELL_TEXT_DARK if _dark_mode else _CELL_TEXT_LIGHT)
 
 
 # ------------------------------------------------------------------ #
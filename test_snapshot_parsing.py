@@ -0,0 +1,81 @@
+import re
+from datetime import datetime, timezone
+from typing import Optional
+
+import pytest
+
+from mybeatsaberstats.snapshot import parse_taken_at
+from mybeatsaberstats.snapshot_view import _parse_percent_text
+
+
+def _baseline_parse_taken_at(t_str: str) -> Optional[datetime]:
+    # 位置決め打ちの高速化を入れる前の解析（Z を外して fromisoformat し、UTC として扱う）
+    try:
+        if t_str.endswith("Z"):
+            t_str = t_str[:-1]
+        return datetime.fromisoformat(t_str).replace(tzinfo=timezone.utc)
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def _baseline_parse_percent(value_str) -> Optional[float]:
+    # PercentageBarDelegate._parse_value として持っていた解析
+    if value_str in (None, ""):
+        return None
+    s = str(value_str).strip()
+    m = re.search(r"([-+]?\d+(?:\.\d+)?)\s*%", s)
+    num_str = m.group(1) if m else s
+    try:
+        return float(num_str)
+    except ValueError:
+        return None
+
+
+@pytest.mark.parametrize(
+    "t_str",
+    [
+        "2026-01-05T23:30:00Z",
+        "2026-01-05T23:30:00.123Z",
+        "2026-01-05T23:30:00.123456Z",
+        "2026-01-05T23:30:00.5Z",
+        "2026-01-05T23:30:00",
+        "2026-01-05T23:30:00.123456",
+        "2026-01-05T23:30:00+09:00",
+        "2026-01-05T23:30:00.123+09:00",
+        "2026-02-30T00:00:00Z",
+        "2026-01-05T25:00:00Z",
+        "2026-01-05 23:30:00",
+        "not a date",
+        "",
+    ],
+)
+def test_parse_taken_at_matches_fromisoformat(t_str: str) -> None:
+    assert parse_taken_at(t_str) == _baseline_parse_taken_at(t_str)
+
+
+def test_parse_taken_at_returns_utc_or_none() -> None:
+    dt = parse_taken_at("2026-01-05T23:30:00.123Z")
+    assert dt == datetime(2026, 1, 5, 23, 30, 0, 123000, tzinfo=timezone.utc)
+    assert dt is not None and dt.tzinfo is timezone.utc
+    assert parse_taken_at("invalid") is None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "12 (45.3%)",
+        "1,234 (0.0%)",
+        "95.12%",
+        "-3.5 %",
+        "+2%",
+        "88.00",
+        "0",
+        "",
+        None,
+        "-",
+        "abc",
+        "Lv.3",
+    ],
+)
+def test_parse_percent_text_matches_delegate_parser(value) -> None:
+    assert _parse_percent_text(value) == _baseline_parse_percent(value)